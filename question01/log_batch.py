@@ -0,0 +1,120 @@
+import os
+import glob
+import heapq
+import argparse
+import tempfile
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+from main import LOG_HEADER, parse_log_line, write_markdown_report
+
+CHUNK_SIZE = 16 * 1024 * 1024
+MERGE_FAN_IN = 64
+# 로그 옆에 생기는 체크포인트, 인덱스, 임시 파일은 로그가 아님
+SIDECAR_SUFFIXES = ('.checkpoint', '.idx', '.tmp')
+
+# 디렉터리면 안의 .log 파일과 순환된 로그(.log.1 ...) 전체, 아니면 glob 패턴으로 로그 파일 목록 만들기
+def expand_log_paths(pattern):
+  if os.path.isdir(pattern):
+    patterns = [os.path.join(pattern, '*.log'), os.path.join(pattern, '*.log.[0-9]*')]
+  else:
+    patterns = [pattern]
+  paths = set()
+  for pattern in patterns:
+    paths.update(
+      path for path in glob.glob(pattern)
+      if os.path.isfile(path) and not path.endswith(SIDECAR_SUFFIXES)
+    )
+  return sorted(paths)
+
+# 파일을 chunk_size 단위 (시작, 끝) 바이트 구간으로 나누기
+# 각 구간은 시작 위치가 구간 안에 있는 줄만 맡으므로 줄 중간에서 잘리지 않음
+def split_file_chunks(file_path, chunk_size=CHUNK_SIZE):
+  size = os.path.getsize(file_path)
+  return [(file_path, start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+def record_timestamp(item):
+  return item['timestamp']
+
+# 한 구간의 로그를 읽어서 시간순으로 정렬된 레코드 목록 반환
+def parse_log_chunk(chunk):
+  file_path, start, end = chunk
+  records = []
+  with open(file_path, 'rb') as file:
+    if start > 0:
+      # 앞 구간에 걸친 줄은 건너뜀
+      file.seek(start - 1)
+      file.readline()
+    while file.tell() < end:
+      raw_line = file.readline()
+      if not raw_line:
+        break
+      line = raw_line.decode('utf-8').strip()
+      record = parse_log_line(line) if line and line != LOG_HEADER else None
+      if record is not None:
+        records.append(record)
+  records.sort(key=record_timestamp)
+  return records
+
+def format_log_line(item):
+  return f"{item['timestamp']},{item['event']},{item['message']}\n"
+
+# 정렬된 레코드를 임시 run 파일에 로그 형식 그대로 저장하고 경로 반환
+def write_run(records, temp_dir):
+  handle, run_file = tempfile.mkstemp(suffix='.log', dir=temp_dir)
+  with os.fdopen(handle, 'w', encoding='utf-8') as file:
+    file.writelines(map(format_log_line, records))
+  return run_file
+
+# 작업 프로세스: 구간 하나를 정렬해서 run 파일로 저장 (레코드 대신 파일 경로만 부모에게 돌려줌)
+def sort_log_chunk(chunk, temp_dir):
+  return write_run(parse_log_chunk(chunk), temp_dir)
+
+def iter_run(run_file):
+  with open(run_file, 'r', encoding='utf-8') as file:
+    for line in file:
+      yield parse_log_line(line.rstrip('\n'))
+
+# run 파일 여러 개를 하나로 병합 (한 번에 최대 fan_in 개만 열고, 넘치면 여러 단계로 병합)
+def merge_runs(run_files, temp_dir, fan_in=MERGE_FAN_IN):
+  while len(run_files) > fan_in:
+    merged = []
+    for start in range(0, len(run_files), fan_in):
+      group = run_files[start:start + fan_in]
+      merged.append(write_run(heapq.merge(*map(iter_run, group), key=record_timestamp), temp_dir))
+      for run_file in group:
+        os.remove(run_file)
+    run_files = merged
+  return heapq.merge(*map(iter_run, run_files), key=record_timestamp)
+
+# 여러 로그 파일을 프로세스 풀에서 나눠 읽고 시간순으로 합쳐서 넘겨줌
+# 작업 프로세스는 정렬한 구간을 임시 파일로 내보내므로 부모는 레코드를 한꺼번에 들고 있지 않음
+def iter_batch_records(paths, workers=None, chunk_size=CHUNK_SIZE, fan_in=MERGE_FAN_IN):
+  chunks = []
+  for path in paths:
+    chunks.extend(split_file_chunks(path, chunk_size))
+
+  with tempfile.TemporaryDirectory() as temp_dir:
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+      run_files = list(executor.map(partial(sort_log_chunk, temp_dir=temp_dir), chunks))
+    yield from merge_runs(run_files, temp_dir, fan_in)
+
+# 여러 로그 파일을 하나의 보고서로 저장
+def batch_markdown_report(pattern, output_file, workers=None, chunk_size=CHUNK_SIZE):
+  paths = expand_log_paths(pattern)
+  if not paths:
+    print('No such file or directory')
+    return 0
+  return write_markdown_report(iter_batch_records(paths, workers, chunk_size), output_file)
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Batch mission log analyzer')
+  parser.add_argument('pattern', help='로그 디렉터리 또는 glob 패턴 (예: "logs/*.log")')
+  parser.add_argument('--output', default='log_analysis.md')
+  parser.add_argument('--workers', type=int, default=None, help='기본값은 CPU 코어 수')
+  parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+  args = parser.parse_args()
+
+  count = batch_markdown_report(args.pattern, args.output, args.workers, args.chunk_size)
+  print(f'{count} log rows saved to {args.output}')
@@ -0,0 +1,157 @@
+import os
+import sys
+import time
+import struct
+import argparse
+import calendar
+from array import array
+from bisect import bisect_left, bisect_right
+
+from main import file_path, LOG_HEADER, parse_log_line, parse_log_line_regex
+
+# 인덱스 파일 구조
+#   헤더: 매직(4) 버전(u16) 섹션 수(u16) 로그 크기(u64) 로그 수정 시각(u64, ns)
+#   섹션: 이름 길이(u16) 이름 레코드 수(u64) 타임스탬프(int64 배열) 바이트 위치(int64 배열)
+# '*' 섹션은 전체 로그, 나머지는 이벤트 레벨(INFO/WARNING/ERROR ...)별 목록이며 모두 시간순으로 정렬됨
+INDEX_MAGIC = b'MLIX'
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct('<4sHHQQ')
+SECTION_HEADER = struct.Struct('<HQ')
+ALL_EVENTS = '*'
+# --start/--end 로 받는 시각 형식 (날짜를 빼면 로그 첫 줄의 날짜)
+TIME_BOUND_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%H:%M:%S', '%H:%M')
+
+# 인덱스 파일 경로 (로그 파일 옆에 저장)
+def index_path(file_path):
+  return file_path + '.idx'
+
+# 로그를 한 번 훑어서 시간순 위치 목록과 레벨별 목록을 만들어 저장
+def build_log_index(file_path, index_file=None):
+  if index_file is None:
+    index_file = index_path(file_path)
+
+  # 섹션마다 (타임스탬프, 바이트 위치) 두 개의 int64 배열에 바로 추가
+  # 로그는 원래 시간순이므로 순서가 어긋난 줄이 있었던 섹션만 저장할 때 정렬
+  entries = {}
+  unsorted = set()
+  offset = 0
+  with open(file_path, 'rb') as file:
+    for raw_line in file:
+      line = raw_line.decode('utf-8').strip()
+      # 타임스탬프를 epoch 로 바꿔 주는 파서 사용 (잘못된 줄은 인덱스에 넣지 않음)
+      record = parse_log_line_regex(line) if line and line != LOG_HEADER else None
+      if record is not None:
+        epoch = record['epoch']
+        for name in (ALL_EVENTS, record['event']):
+          section = entries.get(name)
+          if section is None:
+            section = entries[name] = (array('q'), array('q'))
+          elif epoch < section[0][-1]:
+            unsorted.add(name)
+          section[0].append(epoch)
+          section[1].append(offset)
+      offset += len(raw_line)
+
+  stat = os.stat(file_path)
+  with open(index_file, 'wb') as file:
+    file.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(entries), stat.st_size, stat.st_mtime_ns))
+    for name, (timestamps, offsets) in entries.items():
+      if name in unsorted:
+        items = sorted(zip(timestamps, offsets))
+        timestamps = array('q', [item[0] for item in items])
+        offsets = array('q', [item[1] for item in items])
+      encoded = name.encode('utf-8')
+      file.write(SECTION_HEADER.pack(len(encoded), len(timestamps)))
+      file.write(encoded)
+      timestamps.tofile(file)
+      offsets.tofile(file)
+  return index_file
+
+# 인덱스 파일 읽기 (로그가 바뀌었으면 None)
+def load_log_index(file_path, index_file=None):
+  if index_file is None:
+    index_file = index_path(file_path)
+
+  try:
+    with open(index_file, 'rb') as file:
+      magic, version, section_count, log_size, log_mtime = INDEX_HEADER.unpack(file.read(INDEX_HEADER.size))
+      stat = os.stat(file_path)
+      if magic != INDEX_MAGIC or version != INDEX_VERSION:
+        return None
+      if log_size != stat.st_size or log_mtime != stat.st_mtime_ns:
+        return None
+
+      sections = {}
+      for _ in range(section_count):
+        name_length, count = SECTION_HEADER.unpack(file.read(SECTION_HEADER.size))
+        name = file.read(name_length).decode('utf-8')
+        timestamps = array('q')
+        timestamps.fromfile(file, count)
+        offsets = array('q')
+        offsets.fromfile(file, count)
+        sections[name] = (timestamps, offsets)
+      return sections
+  except (FileNotFoundError, struct.error, EOFError):
+    return None
+
+# 인덱스가 없거나 오래됐으면 다시 만들어서 읽기
+def open_log_index(file_path, index_file=None):
+  sections = load_log_index(file_path, index_file)
+  if sections is None:
+    build_log_index(file_path, index_file)
+    sections = load_log_index(file_path, index_file)
+  return sections
+
+# 'YYYY-MM-DD HH:MM[:SS]' 또는 'HH:MM[:SS]' 를 epoch 초로 변환 (형식이 맞지 않으면 ValueError)
+# 날짜가 없으면 day_epoch (그날 00:00 의 epoch) 기준
+def time_bound_to_epoch(text, day_epoch=0):
+  for time_format in TIME_BOUND_FORMATS:
+    try:
+      parsed = time.strptime(text.strip(), time_format)
+    except ValueError:
+      continue
+    if time_format.startswith('%Y'):
+      return calendar.timegm(parsed)
+    return day_epoch + parsed.tm_hour * 3600 + parsed.tm_min * 60 + parsed.tm_sec
+  raise ValueError(f"invalid time {text!r} (expected 'YYYY-MM-DD HH:MM[:SS]' or 'HH:MM[:SS]')")
+
+# argparse 에서 --start/--end 형식 확인용
+def time_bound(text):
+  try:
+    time_bound_to_epoch(text)
+  except ValueError as error:
+    raise argparse.ArgumentTypeError(str(error))
+  return text
+
+# 이벤트 레벨과 시간 범위(start 이상 end 이하)에 맞는 로그만 찾아서 읽기
+# start/end 에 날짜가 없으면 로그 첫 줄의 날짜를 사용 (예: start='10:00', end='11:00')
+def query_log(file_path, event=None, start=None, end=None, index_file=None):
+  sections = open_log_index(file_path, index_file)
+  timestamps, offsets = sections.get(event or ALL_EVENTS, (array('q'), array('q')))
+  first = sections.get(ALL_EVENTS, (array('q'), array('q')))[0]
+  day_epoch = first[0] - first[0] % 86400 if first else 0
+
+  low = bisect_left(timestamps, time_bound_to_epoch(start, day_epoch)) if start else 0
+  high = bisect_right(timestamps, time_bound_to_epoch(end, day_epoch)) if end else len(timestamps)
+
+  with open(file_path, 'rb') as file:
+    for position in range(low, high):
+      file.seek(offsets[position])
+      yield parse_log_line(file.readline().decode('utf-8').strip())
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Mission computer log index')
+  parser.add_argument('--log', default=file_path)
+  parser.add_argument('--build', action='store_true', help='인덱스를 새로 생성')
+  parser.add_argument('--event', help='INFO, WARNING, ERROR ...')
+  parser.add_argument('--start', type=time_bound, help="'YYYY-MM-DD HH:MM[:SS]' 또는 'HH:MM[:SS]'")
+  parser.add_argument('--end', type=time_bound, help="'YYYY-MM-DD HH:MM[:SS]' 또는 'HH:MM[:SS]'")
+  args = parser.parse_args()
+
+  if args.build:
+    print(f'Index saved to {build_log_index(args.log)}')
+    sys.exit(0)
+
+  for record in query_log(args.log, args.event, args.start, args.end):
+    print(f"{record['timestamp']},{record['event']},{record['message']}")
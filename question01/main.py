@@ -1,58 +1,244 @@
 import re
+import os
+import json
+import time
+import argparse
+import calendar
 
 file_path = 'logs/mission_computer_main.log'
+LOG_HEADER = 'timestamp,event,message'
+BLOCK_SIZE = 64 * 1024
+MARKDOWN_HEADER = "# Log Report \n\n| Timestamp | Event | Message |\n"
+WRITE_BUFFER_SIZE = 1024 * 1024
+FOLLOW_INTERVAL = 1.0
+# 타임스탬프('YYYY-MM-DD HH:MM:SS' 형식만), 이벤트, 메시지 (메시지 안의 쉼표는 그대로 유지)
+LOG_PATTERN = re.compile(r'(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d),([^,]*),(.*)')
+MINUTE_CACHE_SIZE = 100000
+minute_epoch_cache = {}
+
+# 로그 한 줄을 오브젝트 형식으로 변환 (쉼표가 두 개 미만인 잘못된 줄은 None)
+# 모든 파서는 잘못된 줄에 None 을 반환하고, 읽는 쪽은 그 줄을 건너뜀
+def parse_log_line(line):
+  lines = line.split(',', 2)
+  if len(lines) < 3:
+    return None
+  return {
+    'timestamp': lines[0],
+    'event': lines[1],
+    'message': lines[2]
+  }
+
+# 'YYYY-MM-DD HH:MM:SS' 타임스탬프를 epoch 초로 변환
+# 로그는 시간순이라 같은 분의 줄이 이어지므로 분 단위까지는 한 번만 계산하고 줄마다 초만 더함
+def timestamp_to_epoch(timestamp):
+  minute = timestamp[:16]
+  minute_epoch = minute_epoch_cache.get(minute)
+  if minute_epoch is None:
+    if len(minute_epoch_cache) >= MINUTE_CACHE_SIZE:
+      minute_epoch_cache.clear()
+    minute_epoch = calendar.timegm((
+      int(minute[:4]), int(minute[5:7]), int(minute[8:10]), int(minute[11:13]), int(minute[14:16]), 0
+    ))
+    minute_epoch_cache[minute] = minute_epoch
+  return minute_epoch + int(timestamp[17:19])
+
+# 미리 컴파일한 정규식으로 로그 한 줄을 나누고 타임스탬프도 epoch 초로 한 번에 변환
+# split 파서보다 느리므로 epoch 가 필요한 곳(log_index.py 등)에서만 사용 (보고서 기본값은 split)
+# 타임스탬프 형식이 맞지 않는 줄도 None (epoch 로 바꿀 수 없으므로)
+def parse_log_line_regex(line):
+  match = LOG_PATTERN.fullmatch(line)
+  if match is None:
+    return None
+  timestamp, event, message = match.groups()
+  return {
+    'timestamp': timestamp,
+    'event': event,
+    'message': message,
+    'epoch': timestamp_to_epoch(timestamp)
+  }
+
+PARSERS = {
+  'split': parse_log_line,
+  'regex': parse_log_line_regex
+}
+
+# 로그 파일을 한 줄씩 읽어서 오브젝트를 하나씩 넘겨줌 (파일 전체를 메모리에 올리지 않음)
+def iter_log_records(file_path, parser=parse_log_line):
+  try:
+    with open(file_path, 'r') as file:
+      for line in file:
+        line = line.strip()
+        if line and line != LOG_HEADER:
+          record = parser(line)
+          if record is not None:
+            yield record
+  except FileNotFoundError:
+    print('No such file or directory')
+
+# 파일 끝에서부터 블록 단위로 읽으면서 한 줄씩 역순으로 넘겨줌
+def iter_reverse_lines(file_path, block_size=BLOCK_SIZE):
+  try:
+    with open(file_path, 'rb') as file:
+      file.seek(0, 2)
+      position = file.tell()
+      remainder = b''
+      while position > 0:
+        read_size = min(block_size, position)
+        position -= read_size
+        file.seek(position)
+        block = file.read(read_size) + remainder
+        lines = block.split(b'\n')
+        # 첫 조각은 앞 블록과 이어질 수 있으므로 다음 블록으로 넘김
+        remainder = lines.pop(0)
+        for line in reversed(lines):
+          line = line.rstrip(b'\r')
+          if line:
+            yield line.decode('utf-8')
+      remainder = remainder.rstrip(b'\r')
+      if remainder:
+        yield remainder.decode('utf-8')
+  except FileNotFoundError:
+    print('No such file or directory')
 
 # 로그 파일을 열고 내용 배열 형식으로 저장
 def read_file(file_path):
-  log_lines = []
   try:
     with open(file_path, 'r') as file:
-      logs = file.readlines()
-      for log in logs:
-        log_lines.append(log)
-    return log_lines
+      return [log for log in file]
   except:
     return 'No such file or directory'
-  
+
 # 로그 파일 열고 내용 오브젝트 형식으로 저장
 def read_file_dictionary(file_path):
-  dictionary_lines = []
-  try:
-    with open(file_path, 'r') as file:
-      for line in file:
-        line = line.strip()
-        if line:
-          lines = line.split(',')
-          dictionary_lines.append({
-            'timestamp': lines[0],
-            'event': lines[1],
-            'message': lines[2]
-          })
-    return dictionary_lines
-  except:
-    return 'No such file or directory'
-  
+  return list(iter_log_records(file_path))
+
 # 시간 역순으로 출력
-def print_revers(logs):
-  for log in reversed(logs):
+def print_revers(file_path):
+  for log in iter_reverse_lines(file_path):
     print(log)
 
-logs = read_file(file_path)
-logs_dictionary = read_file_dictionary(file_path)
+# 레코드 하나를 마크다운 표의 한 행으로 변환
+def format_markdown_row(item):
+  return f"| {item['timestamp']} | {item['event']} | {item['message']} |\n"
 
 # 로그파일 마크다운 형식으로 변환
-def generate_markdown_report(logs_dictionary):
-  md_content = "# Log Report \n\n"
-  md_content += "| Timestamp | Event | Message |\n"
-  
-  for item in logs_dictionary[1:]:
-    md_content += f"| {item['timestamp']} | {item['event']} | {item['message']} |\n"
-  return md_content
+def generate_markdown_report(records):
+  md_content = [MARKDOWN_HEADER]
+  for item in records:
+    md_content.append(format_markdown_row(item))
+  return ''.join(md_content)
 
 # 보고서 파일 저장
 def save_markdown_report(md_content, output_file):
   with open(output_file, 'w', encoding='utf-8') as file:
     file.write(md_content)
 
-report = generate_markdown_report(logs_dictionary)
-save_markdown_report(report, 'log_analysis.md')
\ No newline at end of file
+# 레코드를 읽는 대로 보고서 파일에 바로 기록 (보고서 전체를 메모리에 만들지 않음)
+def write_markdown_report(records, output_file, buffer_size=WRITE_BUFFER_SIZE):
+  count = 0
+  with open(output_file, 'w', encoding='utf-8', buffering=buffer_size) as file:
+    file.write(MARKDOWN_HEADER)
+    for item in records:
+      file.write(format_markdown_row(item))
+      count += 1
+  return count
+
+
+# 체크포인트 파일 경로 (로그 파일 옆에 저장)
+def checkpoint_path(file_path):
+  return file_path + '.checkpoint'
+
+# 체크포인트 읽기: 마지막으로 처리한 바이트 위치와 그때 보고서 파일의 크기/수정 시각
+def load_checkpoint(checkpoint_file):
+  try:
+    with open(checkpoint_file, 'r', encoding='utf-8') as file:
+      checkpoint = json.load(file)
+    return {
+      'offset': int(checkpoint.get('offset', 0)),
+      'report_size': checkpoint.get('report_size'),
+      'report_mtime_ns': checkpoint.get('report_mtime_ns')
+    }
+  except (FileNotFoundError, ValueError, AttributeError):
+    return {'offset': 0, 'report_size': None, 'report_mtime_ns': None}
+
+# 처리한 바이트 위치와 보고서 상태 저장 (임시 파일에 쓴 뒤 교체해서 중간에 끊겨도 깨지지 않게 함)
+def save_checkpoint(checkpoint_file, file_path, offset, output_file):
+  stat = os.stat(output_file)
+  temp_file = checkpoint_file + '.tmp'
+  with open(temp_file, 'w', encoding='utf-8') as file:
+    json.dump({
+      'file': file_path,
+      'offset': offset,
+      'report_size': stat.st_size,
+      'report_mtime_ns': stat.st_mtime_ns
+    }, file)
+  os.replace(temp_file, checkpoint_file)
+
+# 보고서가 체크포인트를 저장한 뒤로 바뀌지 않았는지 (다른 방법으로 다시 만들었으면 이어 붙이면 안 됨)
+def report_matches_checkpoint(output_file, checkpoint):
+  try:
+    stat = os.stat(output_file)
+  except FileNotFoundError:
+    return False
+  return stat.st_size == checkpoint['report_size'] and stat.st_mtime_ns == checkpoint['report_mtime_ns']
+
+# 지난번 이후에 추가된 줄만 읽어서 보고서 끝에 이어 붙임
+def update_markdown_report(file_path, output_file, checkpoint_file=None):
+  if checkpoint_file is None:
+    checkpoint_file = checkpoint_path(file_path)
+  checkpoint = load_checkpoint(checkpoint_file)
+  offset = checkpoint['offset']
+
+  # 로그가 새로 만들어졌거나(크기 감소) 보고서가 없거나 따로 다시 만들어졌으면 처음부터 다시 생성
+  if offset > os.path.getsize(file_path) or not report_matches_checkpoint(output_file, checkpoint):
+    offset = 0
+
+  count = 0
+  mode = 'a' if offset else 'w'
+  with open(file_path, 'rb') as log_file, \
+       open(output_file, mode, encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as report:
+    if offset == 0:
+      report.write(MARKDOWN_HEADER)
+    log_file.seek(offset)
+    for raw_line in log_file:
+      # 아직 다 쓰이지 않은 마지막 줄은 다음 번에 처리
+      if not raw_line.endswith(b'\n'):
+        break
+      offset += len(raw_line)
+      line = raw_line.decode('utf-8').strip()
+      record = parse_log_line(line) if line and line != LOG_HEADER else None
+      if record is not None:
+        report.write(format_markdown_row(record))
+        count += 1
+
+  save_checkpoint(checkpoint_file, file_path, offset, output_file)
+  return count
+
+# 로그 파일을 계속 지켜보면서 추가된 내용을 보고서에 반영
+def follow_log(file_path, output_file, interval=FOLLOW_INTERVAL):
+  while True:
+    try:
+      count = update_markdown_report(file_path, output_file)
+    except FileNotFoundError:
+      # 로그 순환 중에 잠깐 파일이 없으면 새 내용이 없는 것으로 보고 다음 번에 다시 확인
+      count = 0
+    if count:
+      print(f'{count} new log rows appended to {output_file}')
+    time.sleep(interval)
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Mission computer log analyzer')
+  parser.add_argument('--log', default=file_path)
+  parser.add_argument('--output', default='log_analysis.md')
+  parser.add_argument('--follow', action='store_true', help='추가된 로그만 계속 반영')
+  parser.add_argument('--interval', type=float, default=FOLLOW_INTERVAL)
+  parser.add_argument('--parser', choices=PARSERS, default='split')
+  args = parser.parse_args()
+
+  if args.follow:
+    try:
+      follow_log(args.log, args.output, args.interval)
+    except KeyboardInterrupt:
+      print('Follow mode stopped...')
+  else:
+    write_markdown_report(iter_log_records(args.log, PARSERS[args.parser]), args.output)
@@ -0,0 +1,67 @@
+import os
+import time
+import tempfile
+import argparse
+
+from main import LOG_HEADER, parse_log_line, parse_log_line_regex, iter_log_records, timestamp_to_epoch
+
+EVENTS = ['INFO', 'WARNING', 'ERROR']
+
+# 기존 방식: 쉼표로 전부 나눈 뒤 세 번째 조각만 메시지로 사용 (메시지 안 쉼표에서 잘림)
+def parse_log_line_legacy(line):
+  lines = line.split(',')
+  return {
+    'timestamp': lines[0],
+    'event': lines[1],
+    'message': lines[2]
+  }
+
+# split 파서에 epoch 변환을 더한 것 (regex 파서와 같은 일을 하는 비교 대상)
+def parse_log_line_split_epoch(line):
+  record = parse_log_line(line)
+  if record is not None:
+    record['epoch'] = timestamp_to_epoch(record['timestamp'])
+  return record
+
+# 벤치마크용 가짜 로그 파일 생성 (일부 메시지에 쉼표 포함)
+def write_synthetic_log(path, line_count):
+  with open(path, 'w', encoding='utf-8', buffering=1024 * 1024) as file:
+    file.write(LOG_HEADER + '\n')
+    for i in range(line_count):
+      hour, rest = divmod(i % 86400, 3600)
+      minute, second = divmod(rest, 60)
+      day = 1 + (i // 86400) % 28
+      message = f'Sensor {i % 97} reading, value {i % 1000}, nominal.' if i % 3 == 0 else f'Routine check {i}.'
+      file.write(f'2023-08-{day:02d} {hour:02d}:{minute:02d}:{second:02d},{EVENTS[i % 3]},{message}\n')
+
+# 파서 하나로 파일 전체를 읽는 데 걸린 시간 측정
+def time_parser(path, parser):
+  start = time.perf_counter()
+  count = 0
+  for _ in iter_log_records(path, parser):
+    count += 1
+  return time.perf_counter() - start, count
+
+
+if __name__ == '__main__':
+  arg_parser = argparse.ArgumentParser(description='Log parser micro-benchmark')
+  arg_parser.add_argument('--lines', type=int, default=1000000)
+  args = arg_parser.parse_args()
+
+  with tempfile.TemporaryDirectory() as temp_dir:
+    path = os.path.join(temp_dir, 'synthetic.log')
+    write_synthetic_log(path, args.lines)
+
+    for name, parser in [
+      ('legacy split', parse_log_line_legacy),
+      ('split', parse_log_line),
+      ('split + epoch', parse_log_line_split_epoch),
+      ('regex + epoch', parse_log_line_regex)
+    ]:
+      elapsed, count = time_parser(path, parser)
+      print(f'{name:>14}: {elapsed:.3f} s, {count / elapsed:,.0f} lines/s')
+
+    # 쉼표가 들어간 메시지가 잘리는지 확인
+    sample = '2023-08-27 10:00:00,INFO,Sensor 1 reading, value 2, nominal.'
+    print(f"legacy message: {parse_log_line_legacy(sample)['message']!r}")
+    print(f"regex message : {parse_log_line_regex(sample)['message']!r}")
@@ -0,0 +1,103 @@
+import os
+import csv
+import heapq
+import argparse
+import tempfile
+
+from handle_csv import file_path, to_float, FLAMMABILITY_THRESHOLD
+
+danger_path = 'files/Mars_Base_Inventory_danger.csv'
+CHUNK_ROWS = 100000
+MERGE_FAN_IN = 64
+FLAMMABILITY_COLUMN = 4
+
+# CSV를 chunk_rows 줄씩 나눠서 넘겨줌 (헤더 제외, 각 행 앞에 원래 행 번호를 붙임)
+def iter_inventory_chunks(file_path, chunk_rows=CHUNK_ROWS):
+  with open(file_path, 'r', encoding='utf-8', newline='') as file:
+    reader = csv.reader(file)
+    next(reader, None)
+    chunk = []
+    for index, row in enumerate(reader):
+      if row:
+        chunk.append((index, row))
+      if len(chunk) >= chunk_rows:
+        yield chunk
+        chunk = []
+    if chunk:
+      yield chunk
+
+def is_dangerous(row, threshold):
+  return to_float(row[FLAMMABILITY_COLUMN]) > threshold
+
+# 읽는 즉시 위험 물품만 골라서 바로 저장 (원래 순서 유지)
+def export_dangerous(file_path, output_file, threshold=FLAMMABILITY_THRESHOLD, chunk_rows=CHUNK_ROWS):
+  count = 0
+  with open(output_file, 'w', encoding='utf-8', newline='') as file:
+    writer = csv.writer(file)
+    for chunk in iter_inventory_chunks(file_path, chunk_rows):
+      rows = [row for _, row in chunk if is_dangerous(row, threshold)]
+      writer.writerows(rows)
+      count += len(rows)
+  return count
+
+# 정렬 기준: 인화성 내림차순, 같으면 원래 행 번호 순
+def run_sort_key(run_row):
+  return (-float(run_row[1 + FLAMMABILITY_COLUMN]), int(run_row[0]))
+
+# 정렬된 run 파일을 한 줄씩 읽음 (첫 칸은 원래 행 번호)
+def iter_run(run_file):
+  with open(run_file, 'r', encoding='utf-8', newline='') as file:
+    yield from csv.reader(file)
+
+def write_run(rows, temp_dir):
+  handle, run_file = tempfile.mkstemp(suffix='.csv', dir=temp_dir)
+  with os.fdopen(handle, 'w', encoding='utf-8', newline='') as file:
+    csv.writer(file).writerows(rows)
+  return run_file
+
+# run 파일 여러 개를 하나로 병합 (한 번에 최대 fan_in 개만 열고, 넘치면 여러 단계로 병합)
+def merge_runs(run_files, temp_dir, fan_in=MERGE_FAN_IN):
+  while len(run_files) > fan_in:
+    merged = []
+    for start in range(0, len(run_files), fan_in):
+      group = run_files[start:start + fan_in]
+      merged.append(write_run(heapq.merge(*map(iter_run, group), key=run_sort_key), temp_dir))
+      for run_file in group:
+        os.remove(run_file)
+    run_files = merged
+  return heapq.merge(*map(iter_run, run_files), key=run_sort_key)
+
+# 위험 물품을 인화성 내림차순으로 저장 (chunk 단위로 정렬해서 임시 파일에 쓴 뒤 외부 병합 정렬)
+def export_dangerous_sorted(file_path, output_file, threshold=FLAMMABILITY_THRESHOLD,
+                            chunk_rows=CHUNK_ROWS, fan_in=MERGE_FAN_IN):
+  count = 0
+  with tempfile.TemporaryDirectory() as temp_dir:
+    run_files = []
+    for chunk in iter_inventory_chunks(file_path, chunk_rows):
+      rows = [[index] + row for index, row in chunk if is_dangerous(row, threshold)]
+      if rows:
+        rows.sort(key=lambda run_row: (-to_float(run_row[1 + FLAMMABILITY_COLUMN]), run_row[0]))
+        run_files.append(write_run(rows, temp_dir))
+
+    with open(output_file, 'w', encoding='utf-8', newline='') as file:
+      writer = csv.writer(file)
+      for run_row in merge_runs(run_files, temp_dir, fan_in):
+        writer.writerow(run_row[1:])
+        count += 1
+  return count
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Streaming dangerous inventory export')
+  parser.add_argument('--input', default=file_path)
+  parser.add_argument('--output', default=danger_path)
+  parser.add_argument('--threshold', type=float, default=FLAMMABILITY_THRESHOLD)
+  parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+  parser.add_argument('--unsorted', action='store_true', help='정렬 없이 원래 순서로 저장')
+  args = parser.parse_args()
+
+  if args.unsorted:
+    count = export_dangerous(args.input, args.output, args.threshold, args.chunk_rows)
+  else:
+    count = export_dangerous_sorted(args.input, args.output, args.threshold, args.chunk_rows)
+  print(f'{count} dangerous items saved to {args.output}')
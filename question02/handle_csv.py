@@ -1,67 +1,115 @@
 import csv
-import pickle
-
-file_path = 'files/Mars_base_Inventory_list.csv'
-mars_base_list = []
-
-with open(file_path, 'r', encoding='utf-8') as file:
-  reader = csv.reader(file) #csv 파일 읽기
-  for row in reader:
-    mars_base_list.append(row)
+import sys
+import math
+from array import array
+
+file_path = 'files/Mars_Base_Inventory_List.csv'
+UNKNOWN_VALUE = 'Various'
+FLAMMABILITY_THRESHOLD = 0.7
+
+# 숫자로 바꿀 수 없는 값(Various 등)은 NaN으로 저장
+def to_float(value):
+  try:
+    return float(value)
+  except ValueError:
+    return math.nan
+
+# 숫자 값을 원래 CSV 문자열 형식으로 되돌림
+def format_float(value):
+  if math.isnan(value):
+    return UNKNOWN_VALUE
+  text = repr(value)
+  return text[:-2] if text.endswith('.0') else text
+
+# 열(column) 단위로 저장하는 인벤토리
+# 숫자 열은 array('d')에 연속으로, 문자열 열은 intern 해서 같은 값은 하나의 객체를 공유
+class Inventory:
+  def __init__(self, header=None):
+    self.header = header or []
+    self.substance = []
+    self.weight = array('d')
+    self.specific_gravity = array('d')
+    self.strength = []
+    self.flammability = array('d')
+
+  def __len__(self):
+    return len(self.substance)
+
+  def append(self, row):
+    self.substance.append(sys.intern(row[0]))
+    self.weight.append(to_float(row[1]))
+    self.specific_gravity.append(to_float(row[2]))
+    self.strength.append(sys.intern(row[3]))
+    self.flammability.append(to_float(row[4]))
+
+  # i번째 행을 CSV 한 줄 형식의 리스트로 반환
+  def row(self, i):
+    return [
+      self.substance[i],
+      format_float(self.weight[i]),
+      format_float(self.specific_gravity[i]),
+      self.strength[i],
+      format_float(self.flammability[i])
+    ]
+
+  def rows(self, indices=None):
+    if indices is None:
+      indices = range(len(self))
+    return [self.row(i) for i in indices]
+
+# CSV 파일을 한 번만 읽어서 열 단위 인벤토리로 저장
+def load_inventory(file_path):
+  with open(file_path, 'r', encoding='utf-8') as file:
+    reader = csv.reader(file) #csv 파일 읽기
+    inventory = Inventory(next(reader, []))
+    for row in reader:
+      if row:
+        inventory.append(row)
+  return inventory
 
 # 리스트 출력
-def print_file(list):
-  for item in mars_base_list:
+def print_file(inventory):
+  print(inventory.header)
+  for item in inventory.rows():
     print(item)
 
-# 인화성에 따라 정렬
-def sort_flammability(list):
-  sort_flamm = sorted(list, key=lambda item: item[-1], reverse=True)
-  return sort_flamm
-
-# 인화성 지구 0.7이상 분류
-def filter_flammability(list):
-  dangerous_item = []
-  for item in list[1:]:
-    item[-1] = float(item[-1])
-    if(item[-1] > 0.7):
-      dangerous_item.append(item)
-
-  return dangerous_item
+# 인화성에 따라 정렬 (행 번호 목록 반환, 값이 같으면 원래 순서 유지, NaN은 맨 뒤)
+def sort_flammability(inventory):
+  flammability = inventory.flammability
+  return sorted(range(len(inventory)), key=lambda i: (not math.isnan(flammability[i]), flammability[i]), reverse=True)
 
-sort_list = sort_flammability(mars_base_list)
+# 인화성 지구 threshold 초과 분류 (행 번호 목록 반환)
+def filter_flammability(inventory, indices=None, threshold=FLAMMABILITY_THRESHOLD):
+  if indices is None:
+    indices = range(len(inventory))
+  flammability = inventory.flammability
+  return [i for i in indices if flammability[i] > threshold]
 
-print('------ 원본 ------\n')
-print(mars_base_list)
 
-print('\n\n------ 위험 물품 목록 ------\n')
-dagerous_list = filter_flammability(sort_list)
-print(dagerous_list)
+if __name__ == '__main__':
+  inventory = load_inventory(file_path)
 
-# 위험 물품 목록 새로운 csv 파일로 저장
-with open('files/Mars_Base_Inventory_danger.csv', 'w', encoding="utf-8", newline="") as file:
-  writer = csv.writer(file)
-  writer.writerows(dagerous_list)  # 필터링된 데이터 쓰기
+  print('------ 원본 ------\n')
+  print([inventory.header] + inventory.rows())
 
+  print('\n\n------ 위험 물품 목록 ------\n')
+  dagerous_list = inventory.rows(filter_flammability(inventory, sort_flammability(inventory)))
+  print(dagerous_list)
 
+  # 위험 물품 목록 새로운 csv 파일로 저장
+  with open('files/Mars_Base_Inventory_danger.csv', 'w', encoding="utf-8", newline="") as file:
+    writer = csv.writer(file)
+    writer.writerows(dagerous_list)  # 필터링된 데이터 쓰기
 
-# 파일 읽기 및 리스트 변환
-binary_inventory = []
+  # 이진 파일로 저장 (CSV를 다시 읽지 않고 이미 읽은 인벤토리 사용, 형식은 inventory_binary.py 참고)
+  from inventory_binary import save_inventory_binary, load_inventory_binary
+  save_inventory_binary(inventory, "files/Mars_Base_Inventory_List.bin")
 
-with open(file_path, "r", encoding="utf-8") as file:
-  reader = csv.reader(file)
-  for row in reader:
-    binary_inventory.append(row)
+  # 이진 파일로부터 데이터 읽기
+  binary_inventory = load_inventory_binary("files/Mars_Base_Inventory_List.bin")
 
-# 이진 파일로 저장
-with open("files/Mars_Base_Inventory_List.bin", "wb") as bin_file:
-  pickle.dump(binary_inventory, bin_file)
-
-# 이진 파일로부터 데이터 읽기
-with open("files/Mars_Base_Inventory_List.bin", "rb") as bin_file:
-  binary_list = pickle.load(bin_file)
-
-# 이진 파일로부터 읽은 데이터 출력
-print('\n\n------ 이진 파일 형식 데이터 ------\n')
-for item in binary_list:
-    print(item)
+  # 이진 파일로부터 읽은 데이터 출력
+  print('\n\n------ 이진 파일 형식 데이터 ------\n')
+  print(binary_inventory.header)
+  for item in binary_inventory.rows():
+      print(item)
@@ -0,0 +1,81 @@
+import os
+import time
+import pickle
+import tempfile
+import random
+import argparse
+
+import handle_csv
+import inventory_numpy
+import inventory_binary
+from handle_csv import Inventory
+
+SUBSTANCES = ['Alcohol', 'Gasoline', 'Propane', 'Salt', 'Iron', 'Gunpowder', 'Sodium', 'Wood']
+STRENGTHS = ['Very weak', 'Weak', 'Low', 'High', 'Very high', 'Various']
+
+# 벤치마크용 가짜 인벤토리 생성 (문자열 열은 몇 개의 값을 공유)
+def make_synthetic_inventory(row_count, seed=0):
+  rng = random.Random(seed)
+  inventory = Inventory(['Substance', 'Weight (g/cm³)', 'Specific Gravity', 'Strength', 'Flammability'])
+  for i in range(row_count):
+    inventory.substance.append(SUBSTANCES[i % len(SUBSTANCES)])
+    inventory.strength.append(STRENGTHS[i % len(STRENGTHS)])
+  inventory.weight.extend(rng.uniform(0, 20) for _ in range(row_count))
+  inventory.specific_gravity.extend(inventory.weight)
+  inventory.flammability.extend(round(rng.random(), 2) for _ in range(row_count))
+  return inventory
+
+def measure(name, function, *args):
+  start = time.perf_counter()
+  result = function(*args)
+  print(f'{name:>28}: {time.perf_counter() - start:.3f} s')
+  return result
+
+def benchmark_flammability(inventory):
+  print(f'--- flammability sort/filter, {len(inventory):,} rows ---')
+  order = measure('python sorted()', handle_csv.sort_flammability, inventory)
+  measure('python filter loop', handle_csv.filter_flammability, inventory, order)
+  # inventory_numpy 는 numpy 를 함수 안에서 불러오므로 import 시간이 첫 측정에 섞이지 않게 미리 불러 둠
+  measure('import numpy', __import__, 'numpy')
+  measure('numpy argsort', inventory_numpy.argsort_flammability, inventory)
+  measure('numpy mask filter', inventory_numpy.filter_flammability, inventory)
+  measure('numpy filter + sort', inventory_numpy.sorted_dangerous_indices, inventory)
+  measure('numpy top-100', inventory_numpy.top_k_flammability, inventory, 100)
+
+# 기존 pickle (문자열 리스트의 리스트) 과 새 이진 형식의 저장/읽기 비교
+def benchmark_binary(inventory):
+  print(f'--- binary inventory load, {len(inventory):,} rows ---')
+  with tempfile.TemporaryDirectory() as temp_dir:
+    pickle_path = os.path.join(temp_dir, 'inventory.pkl')
+    binary_path = os.path.join(temp_dir, 'inventory.bin')
+
+    rows = [inventory.header] + inventory.rows()
+    with open(pickle_path, 'wb') as file:
+      measure('pickle.dump', pickle.dump, rows, file)
+    del rows
+    measure('save_inventory_binary', inventory_binary.save_inventory_binary, inventory, binary_path)
+    print(f"{'file size':>28}: pickle {os.path.getsize(pickle_path):,} B, binary {os.path.getsize(binary_path):,} B")
+
+    with open(pickle_path, 'rb') as file:
+      measure('pickle.load', pickle.load, file)
+    measure('load_inventory_binary', inventory_binary.load_inventory_binary, binary_path)
+
+    def read_one_column():
+      with inventory_binary.InventoryFile(binary_path) as inventory_file:
+        with inventory_file.raw_column('flammability') as values:
+          return max(values)
+
+    measure('binary one column (mmap)', read_one_column)
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Inventory benchmarks')
+  parser.add_argument('--rows', type=int, default=10000000)
+  parser.add_argument('--case', choices=['flammability', 'binary', 'all'], default='all')
+  args = parser.parse_args()
+
+  inventory = measure('build synthetic inventory', make_synthetic_inventory, args.rows)
+  if args.case in ('flammability', 'all'):
+    benchmark_flammability(inventory)
+  if args.case in ('binary', 'all'):
+    benchmark_binary(inventory)
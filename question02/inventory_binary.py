@@ -0,0 +1,192 @@
+import sys
+import mmap
+import struct
+from array import array
+
+from handle_csv import Inventory
+
+# 인벤토리 이진 파일 구조 (모든 정수는 little-endian)
+#
+#   헤더 (24 바이트)
+#     magic(4) = b'MINV', version(u16), column_count(u16), row_count(u64), string_table_offset(u64)
+#   열 목록 (열 하나당 48 바이트, column_count 개)
+#     name(32 바이트, utf-8, 뒤는 0으로 채움), kind(u8), padding(7), data_offset(u64)
+#   열 데이터 (각 열의 시작 위치는 8의 배수)
+#     kind 1 = float64 x row_count   (숫자가 아닌 값은 NaN)
+#     kind 2 = u32 x row_count       (문자열 테이블 번호)
+#   문자열 테이블 (string_table_offset 위치)
+#     count(u32), offsets(u32 x (count + 1)), utf-8 로 인코딩한 문자열을 이어 붙인 데이터
+#
+# 파일을 mmap 해서 필요한 열만 memoryview 로 바로 읽을 수 있고, pickle 과 달리 코드를 실행하지 않음
+# (읽기 쪽은 memoryview.cast 를 쓰므로 little-endian 시스템 기준)
+INVENTORY_MAGIC = b'MINV'
+INVENTORY_VERSION = 1
+FILE_HEADER = struct.Struct('<4sHHQQ')
+NAME_SIZE = 32
+COLUMN_ENTRY = struct.Struct(f'<{NAME_SIZE}sB7xQ')
+KIND_FLOAT = 1
+KIND_STRING = 2
+ITEM_SIZE = {KIND_FLOAT: 8, KIND_STRING: 4}
+ITEM_FORMAT = {KIND_FLOAT: 'd', KIND_STRING: 'I'}
+
+# CSV 열 순서대로 (Inventory 속성 이름, 종류)
+COLUMNS = [
+  ('substance', KIND_STRING),
+  ('weight', KIND_FLOAT),
+  ('specific_gravity', KIND_FLOAT),
+  ('strength', KIND_STRING),
+  ('flammability', KIND_FLOAT)
+]
+
+# 열 이름을 32바이트 안으로 자르되 여러 바이트 문자의 중간에서 자르지 않음
+def encode_column_name(name):
+  return name.encode('utf-8')[:NAME_SIZE].decode('utf-8', 'ignore').encode('utf-8')
+
+def align(offset, size=8):
+  return (offset + size - 1) // size * size
+
+def to_little_endian(values):
+  if sys.byteorder != 'little':
+    values.byteswap()
+  return values.tobytes()
+
+# 인벤토리를 이진 파일로 저장
+def save_inventory_binary(inventory, output_file):
+  row_count = len(inventory)
+  names = inventory.header or [attribute for attribute, _ in COLUMNS]
+
+  # 문자열 열은 중복을 없앤 문자열 테이블의 번호로 저장
+  string_ids = {}
+  strings = []
+  encoded_columns = []
+  for attribute, kind in COLUMNS:
+    values = getattr(inventory, attribute)
+    if kind == KIND_STRING:
+      ids = []
+      for value in values:
+        string_id = string_ids.get(value)
+        if string_id is None:
+          string_id = string_ids[value] = len(strings)
+          strings.append(value)
+        ids.append(string_id)
+      encoded_columns.append(to_little_endian(array('I', ids)))
+    else:
+      encoded_columns.append(to_little_endian(array('d', values)))
+
+  offset = FILE_HEADER.size + COLUMN_ENTRY.size * len(COLUMNS)
+  data_offsets = []
+  for data in encoded_columns:
+    offset = align(offset)
+    data_offsets.append(offset)
+    offset += len(data)
+  string_table_offset = align(offset)
+
+  encoded_strings = [value.encode('utf-8') for value in strings]
+  string_offsets = [0]
+  for value in encoded_strings:
+    string_offsets.append(string_offsets[-1] + len(value))
+
+  with open(output_file, 'wb') as file:
+    file.write(FILE_HEADER.pack(INVENTORY_MAGIC, INVENTORY_VERSION, len(COLUMNS), row_count, string_table_offset))
+    for name, (_, kind), data_offset in zip(names, COLUMNS, data_offsets):
+      file.write(COLUMN_ENTRY.pack(encode_column_name(name), kind, data_offset))
+    for data, data_offset in zip(encoded_columns, data_offsets):
+      file.write(b'\0' * (data_offset - file.tell()))
+      file.write(data)
+    file.write(b'\0' * (string_table_offset - file.tell()))
+    file.write(struct.pack(f'<I{len(string_offsets)}I', len(strings), *string_offsets))
+    file.write(b''.join(encoded_strings))
+
+# mmap 으로 연 인벤토리 이진 파일 (열을 읽을 때 필요한 부분만 접근)
+class InventoryFile:
+  def __init__(self, file_path):
+    self.file = open(file_path, 'rb')
+    self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+    self.view = memoryview(self.buffer)
+    magic, version, column_count, self.row_count, self.string_table_offset = FILE_HEADER.unpack_from(self.buffer, 0)
+    if magic != INVENTORY_MAGIC or version != INVENTORY_VERSION:
+      self.close()
+      raise ValueError(f'Not an inventory binary file: {file_path}')
+    # 열 구성(개수, 순서별 종류)이 COLUMNS 와 같은 파일만 읽음
+    if column_count != len(COLUMNS):
+      self.close()
+      raise ValueError(f'Expected {len(COLUMNS)} columns, found {column_count}: {file_path}')
+
+    self.header = []
+    self.columns = {}
+    for i, (attribute, expected_kind) in enumerate(COLUMNS):
+      name, kind, data_offset = COLUMN_ENTRY.unpack_from(self.buffer, FILE_HEADER.size + COLUMN_ENTRY.size * i)
+      if kind != expected_kind:
+        self.close()
+        raise ValueError(f'Column {i} ({attribute}) has kind {kind}, expected {expected_kind}: {file_path}')
+      self.header.append(name.rstrip(b'\0').decode('utf-8'))
+      self.columns[attribute] = (kind, data_offset)
+    self.strings = None
+
+  def __len__(self):
+    return self.row_count
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.close()
+
+  def close(self):
+    if getattr(self, 'view', None) is not None:
+      self.view.release()
+      self.view = None
+    if getattr(self, 'buffer', None) is not None:
+      self.buffer.close()
+      self.buffer = None
+    self.file.close()
+
+  # 열 하나의 바이트 구간을 복사 없이 memoryview 로 반환
+  # 반환된 view 는 파일을 닫기 전에 release 해야 함
+  def column_bytes(self, attribute):
+    kind, data_offset = self.columns[attribute]
+    return self.view[data_offset:data_offset + ITEM_SIZE[kind] * self.row_count]
+
+  # 열 하나를 복사 없이 값 단위 memoryview 로 반환 (float 열은 'd', 문자열 열은 번호 'I')
+  def raw_column(self, attribute):
+    kind, _ = self.columns[attribute]
+    with self.column_bytes(attribute) as data:
+      return data.cast(ITEM_FORMAT[kind])
+
+  # 문자열 테이블은 처음 필요할 때 한 번만 읽음
+  def string_table(self):
+    if self.strings is None:
+      offset = self.string_table_offset
+      (count,) = struct.unpack_from('<I', self.buffer, offset)
+      offsets = struct.unpack_from(f'<{count + 1}I', self.buffer, offset + 4)
+      data_start = offset + 4 + 4 * (count + 1)
+      self.strings = [
+        str(self.buffer[data_start + offsets[i]:data_start + offsets[i + 1]], 'utf-8')
+        for i in range(count)
+      ]
+    return self.strings
+
+  # 열 하나만 파이썬 값 목록으로 읽기
+  def column(self, attribute):
+    kind, _ = self.columns[attribute]
+    with self.raw_column(attribute) as values:
+      if kind == KIND_STRING:
+        strings = self.string_table()
+        return [strings[i] for i in values]
+      return values.tolist()
+
+  # 파일 전체를 Inventory 로 변환
+  def to_inventory(self):
+    inventory = Inventory(list(self.header))
+    for attribute, kind in COLUMNS:
+      if kind == KIND_STRING:
+        setattr(inventory, attribute, self.column(attribute))
+      else:
+        with self.column_bytes(attribute) as data:
+          getattr(inventory, attribute).frombytes(data)
+    return inventory
+
+# 이진 파일을 읽어서 Inventory 로 반환
+def load_inventory_binary(file_path):
+  with InventoryFile(file_path) as inventory_file:
+    return inventory_file.to_inventory()
@@ -0,0 +1,109 @@
+import os
+import sys
+import csv
+import math
+import glob
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from handle_csv import Inventory, load_inventory, sort_flammability, filter_flammability, FLAMMABILITY_THRESHOLD
+
+# 인벤토리 CSV 헤더의 열 이름 (Weight 열은 단위 표기가 파일마다 다를 수 있어서 앞부분만 비교)
+INVENTORY_COLUMNS = ['Substance', 'Weight', 'Specific Gravity', 'Strength', 'Flammability']
+
+# 파일, 디렉터리(안의 .csv 전체), glob 패턴을 받아서 CSV 파일 목록으로 만들기 (중복 제거, 정렬)
+# exclude 에 있는 파일(이 도구가 쓰는 출력 파일 등)은 입력에서 뺌
+def expand_inventory_paths(patterns, exclude=()):
+  excluded = {os.path.abspath(path) for path in exclude if path}
+  paths = set()
+  for pattern in patterns:
+    if os.path.isdir(pattern):
+      pattern = os.path.join(pattern, '*.csv')
+    paths.update(
+      path for path in glob.glob(pattern)
+      if os.path.isfile(path) and os.path.abspath(path) not in excluded
+    )
+  return sorted(paths)
+
+def is_inventory_header(header):
+  return len(header) == len(INVENTORY_COLUMNS) and all(
+    name.strip().lower().startswith(column.lower()) for name, column in zip(header, INVENTORY_COLUMNS)
+  )
+
+# CSV 하나를 읽고 헤더가 인벤토리 형식이 아니면 None (헤더 없는 출력 파일 등)
+def load_checked_inventory(path):
+  inventory = load_inventory(path)
+  if not is_inventory_header(inventory.header):
+    return None
+  return inventory
+
+# 여러 인벤토리를 하나로 합침
+# 같은 물질이 여러 번 나오면 인화성이 가장 높은 행을 남김 (위험 물질을 놓치지 않도록)
+# 인화성이 같으면 먼저 나온 행, NaN 은 어떤 값보다도 낮은 것으로 봄
+# 작업 프로세스에서 넘어온 문자열은 intern 이 풀려 있으므로 다시 intern
+def merge_inventories(inventories):
+  merged = Inventory()
+  positions = {}  # 물질 -> merged 안의 행 번호
+  for inventory in inventories:
+    if not merged.header:
+      merged.header = inventory.header
+    for i, substance in enumerate(inventory.substance):
+      flammability = inventory.flammability[i]
+      position = positions.get(substance)
+      if position is None:
+        positions[substance] = len(merged.substance)
+        merged.substance.append(sys.intern(substance))
+        merged.weight.append(inventory.weight[i])
+        merged.specific_gravity.append(inventory.specific_gravity[i])
+        merged.strength.append(sys.intern(inventory.strength[i]))
+        merged.flammability.append(flammability)
+        continue
+      current = merged.flammability[position]
+      if flammability > current or (math.isnan(current) and not math.isnan(flammability)):
+        merged.weight[position] = inventory.weight[i]
+        merged.specific_gravity[position] = inventory.specific_gravity[i]
+        merged.strength[position] = sys.intern(inventory.strength[i])
+        merged.flammability[position] = flammability
+  return merged
+
+# 헤더가 맞지 않는 파일은 경고를 출력하고 건너뜀
+def skip_invalid_inventories(paths, inventories):
+  for path, inventory in zip(paths, inventories):
+    if inventory is None:
+      print(f'Skipping {path}: header does not match {INVENTORY_COLUMNS}')
+    else:
+      yield inventory
+
+# 여러 CSV 파일을 프로세스 풀에서 나눠 읽고 하나의 열 단위 인벤토리로 합침
+def load_inventories(paths, workers=None):
+  if len(paths) == 1:
+    return merge_inventories(skip_invalid_inventories(paths, [load_checked_inventory(paths[0])]))
+  with ProcessPoolExecutor(max_workers=workers) as executor:
+    # 결과는 파일 순서대로 돌아오므로 중복 제거 결과가 항상 같음
+    return merge_inventories(skip_invalid_inventories(paths, executor.map(load_checked_inventory, paths)))
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Fleet-wide inventory loader')
+  parser.add_argument('patterns', nargs='+', help='CSV 파일, 디렉터리 또는 glob 패턴')
+  parser.add_argument('--output', default='files/Mars_Base_Inventory_danger.csv')
+  parser.add_argument('--binary', help='합친 인벤토리를 이진 파일로도 저장')
+  parser.add_argument('--threshold', type=float, default=FLAMMABILITY_THRESHOLD)
+  parser.add_argument('--workers', type=int, default=None, help='기본값은 CPU 코어 수')
+  args = parser.parse_args()
+
+  paths = expand_inventory_paths(args.patterns, exclude=[args.output, args.binary])
+  if not paths:
+    print('No such file or directory')
+  else:
+    inventory = load_inventories(paths, args.workers)
+    print(f'{len(paths)} files, {len(inventory)} unique substances')
+
+    dangerous = filter_flammability(inventory, sort_flammability(inventory), args.threshold)
+    with open(args.output, 'w', encoding='utf-8', newline='') as file:
+      csv.writer(file).writerows(inventory.rows(dangerous))
+    print(f'{len(dangerous)} dangerous items saved to {args.output}')
+
+    if args.binary:
+      from inventory_binary import save_inventory_binary
+      save_inventory_binary(inventory, args.binary)
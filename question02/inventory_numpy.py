@@ -0,0 +1,43 @@
+from handle_csv import FLAMMABILITY_THRESHOLD
+
+# numpy는 이 모듈의 함수를 쓸 때만 필요하므로 함수 안에서 불러옴
+def flammability_array(inventory):
+  import numpy as np
+  # array('d')의 메모리를 복사 없이 그대로 사용
+  return np.frombuffer(inventory.flammability, dtype=np.float64)
+
+# 인화성 내림차순 행 번호 (값이 같으면 원래 순서 유지, NaN은 맨 뒤)
+def argsort_flammability(inventory, descending=True):
+  import numpy as np
+  flammability = flammability_array(inventory)
+  if descending:
+    return np.argsort(-flammability, kind='stable')
+  return np.argsort(flammability, kind='stable')
+
+# 인화성이 threshold를 넘는 행인지 나타내는 boolean 마스크
+def flammability_mask(inventory, threshold=FLAMMABILITY_THRESHOLD):
+  return flammability_array(inventory) > threshold
+
+# 인화성이 threshold를 넘는 행 번호 (원래 순서)
+def filter_flammability(inventory, threshold=FLAMMABILITY_THRESHOLD):
+  import numpy as np
+  return np.flatnonzero(flammability_mask(inventory, threshold))
+
+# threshold를 넘는 행만 골라서 인화성 내림차순으로 정렬한 행 번호
+def sorted_dangerous_indices(inventory, threshold=FLAMMABILITY_THRESHOLD):
+  import numpy as np
+  order = filter_flammability(inventory, threshold)
+  flammability = flammability_array(inventory)[order]
+  return order[np.argsort(-flammability, kind='stable')]
+
+# 인화성이 가장 높은 k개 행 번호 (전체 정렬 없이 argpartition으로 후보만 고른 뒤 정렬)
+def top_k_flammability(inventory, k):
+  import numpy as np
+  flammability = flammability_array(inventory)
+  k = min(k, len(flammability))
+  if k <= 0:
+    return np.empty(0, dtype=np.intp)
+  # NaN은 후보에서 빠지도록 -inf로 취급
+  keys = np.nan_to_num(flammability, nan=-np.inf)
+  candidates = np.argpartition(-keys, k - 1)[:k]
+  return candidates[np.lexsort((candidates, -keys[candidates]))]
@@ -1,25 +1,204 @@
-import random
+import time
+import atexit
+import struct
+import locale
 import datetime
+import threading
 
 seed = 12345  # 초기값(Seed) - 변경하면 난수의 패턴이 달라짐
 
-def lcg(min, max):
-  global seed
+# 상태를 객체 안에 갖는 LCG 난수 생성기
+# 같은 seed 면 항상 같은 수열이 나오고, jump 로 N 단계를 O(log N) 에 건너뛸 수 있어서
+# 작업자마다 겹치지 않는 구간(substream)을 나눠 줄 수 있음
+class LcgGenerator:
   a = 1103515245  # 곱셈 상수
   c = 12345  # 덧셈 상수
   m = 2**31  # 모듈러 값 (2의 거듭제곱 사용)
 
-  #lcg 알고리즘 변형
-  # 객체의 메모리 주소를 이용해 seed 설정 seed 값 변경을 위함
-  seed = (a * seed + c + id(seed)) % m 
+  def __init__(self, seed=seed):
+    self.state = seed % self.m
+
+  def next(self):
+    self.state = (self.a * self.state + self.c) % self.m
+    return self.state
+
+  # min 이상 max 이하 정수
+  # 2의 거듭제곱을 법으로 하는 LCG 는 하위 비트의 주기가 짧으므로 (최하위 비트는 홀짝이 번갈아 나옴)
+  # 나머지 대신 상위 비트로 구간을 나눔
+  def randint(self, min, max):
+    return min + self.next() * (max - min + 1) // self.m
+
+  # min 이상 max 미만 실수
+  def uniform(self, min, max):
+    return min + (max - min) * self.next() / self.m
+
+  def random_number(self, min, max):
+    if isinstance(min, int) and isinstance(max, int):
+      return self.randint(min, max)
+    return self.uniform(min, max)
+
+  # steps 단계를 한 번에 건너뜀
+  # x -> a*x + c 를 steps 번 합성한 x -> A*x + C 를 제곱을 반복해서 계산
+  def jump(self, steps):
+    mult, inc = 1, 0
+    a, c = self.a, self.c
+    while steps > 0:
+      if steps & 1:
+        mult = (mult * a) % self.m
+        inc = (inc * a + c) % self.m
+      c = ((a + 1) * c) % self.m
+      a = (a * a) % self.m
+      steps >>= 1
+    self.state = (mult * self.state + inc) % self.m
+    return self
+
+  def copy(self):
+    return LcgGenerator(self.state)
 
-  return min + (seed % (max - min + 1))
+  # 작업자 count 명에게 stride 단계씩 떨어진 생성기를 나눠 줌 (i 번째는 i * stride 단계 뒤에서 시작)
+  def split(self, count, stride):
+    generators = [self.copy()]
+    for _ in range(count - 1):
+      generators.append(generators[-1].copy().jump(stride))
+    return generators
+
+default_generator = LcgGenerator(seed)
+
+def lcg(min, max):
+  return default_generator.randint(min, max)
 
 def get_random_number(min, max):
-  return lcg(min, max)
+  return default_generator.random_number(min, max)
+
+# 센서별 값 범위 (정수 센서는 min, max 포함 정수, 나머지는 실수)
+ENV_RANGES = {
+  'mars_base_internal_temperature': (18, 30, int),
+  'mars_base_external_temperature': (0, 21, int),
+  'mars_base_internal_humidity': (50, 60, int),
+  'mars_base_external_illuminance': (500, 715, int),
+  'mars_base_internal_co2': (0.02, 0.1, float),
+  'mars_base_internal_oxygen': (4, 7, float)
+}
+
+LOG_FILENAME = "logs/mars_base_log.txt"
+# 형식별 기본 로그 파일 (sensor_log.py 는 텍스트 로그만 읽으므로 csv/binary 는 다른 파일에 씀)
+LOG_FILENAMES = {
+  'text': LOG_FILENAME,
+  'csv': "logs/mars_base_log.csv",
+  'binary': "logs/mars_base_log.bin"
+}
+# 기존 로그와 같은 인코딩 (open() 기본값과 동일)
+LOG_ENCODING = locale.getpreferredencoding(False)
+LOG_KEYS = [
+  'mars_base_internal_temperature',
+  'mars_base_external_temperature',
+  'mars_base_internal_humidity',
+  'mars_base_external_illuminance',
+  'mars_base_internal_co2',
+  'mars_base_internal_oxygen'
+]
+TEXT_LOG_FORMAT = (
+  "{} - "
+  "Internal Temperature: {:.2f} °C, "
+  "External Temperature: {:.2f} °C, "
+  "Internal Humidity: {:.2f} %, "
+  "External Illuminance: {:.2f} W/m2, "
+  "Internal CO2: {:.2f} %, "
+  "Internal Oxygen: {:.2f} %\n"
+)
+# 바이너리 한 건: epoch 초(float64) + 센서 값 6개(float64)
+BINARY_LOG_RECORD = struct.Struct('<7d')
+
+# 파일을 열어 둔 채로 측정값을 모아서 한꺼번에 쓰는 로그 기록기
+# 모인 크기가 buffer_size 를 넘으면 바로, 그렇지 않으면 flush_interval 초마다 백그라운드 스레드가 파일에 씀
+# (기록이 끊겨도 마지막 측정값이 flush_interval 초 넘게 버퍼에 남지 않음, None 이면 버퍼가 찰 때와 close 때만 씀)
+class SensorLogWriter:
+  def __init__(self, log_filename=None, format='text', buffer_size=64 * 1024, flush_interval=1.0):
+    if format not in LOG_FILENAMES:
+      raise ValueError(f'Unknown log format: {format}')
+    self.format = format
+    self.buffer_size = buffer_size
+    self.flush_interval = flush_interval
+    self.file = open(log_filename or LOG_FILENAMES[format], 'ab')
+    self.buffer = []
+    self.buffered_bytes = 0
+    self.lock = threading.Lock()
+    # 같은 초 안의 측정값은 시간 문자열을 다시 만들지 않음
+    self.cached_second = None
+    self.cached_time = ''
+    self.closed = threading.Event()
+    self.flush_thread = None
+    if flush_interval:
+      self.flush_thread = threading.Thread(target=self.flush_periodically, name='sensor-log-flush', daemon=True)
+      self.flush_thread.start()
+    atexit.register(self.close)
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.close()
+
+  def format_time(self, now):
+    second = int(now)
+    if second != self.cached_second:
+      self.cached_second = second
+      self.cached_time = datetime.datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+    return self.cached_time
+
+  def encode(self, env_values, now):
+    values = [env_values[key] for key in LOG_KEYS]
+    if self.format == 'binary':
+      return BINARY_LOG_RECORD.pack(now, *values)
+    if self.format == 'csv':
+      return (self.format_time(now) + ',' + ','.join(f'{value:.2f}' for value in values) + '\n').encode(LOG_ENCODING)
+    return TEXT_LOG_FORMAT.format(self.format_time(now), *values).encode(LOG_ENCODING)
+
+  def write(self, env_values, now=None):
+    if now is None:
+      now = time.time()
+    data = self.encode(env_values, now)
+    with self.lock:
+      self.buffer.append(data)
+      self.buffered_bytes += len(data)
+      if self.buffered_bytes >= self.buffer_size:
+        self.flush_buffer()
+
+  def write_batch(self, env_values_list, now=None):
+    for env_values in env_values_list:
+      self.write(env_values, now)
+
+  # lock 을 잡은 상태에서 호출
+  def flush_buffer(self):
+    if self.buffer and not self.file.closed:
+      self.file.write(b''.join(self.buffer))
+      self.file.flush()
+    self.buffer = []
+    self.buffered_bytes = 0
+
+  def flush(self):
+    with self.lock:
+      self.flush_buffer()
+
+  def flush_periodically(self):
+    while not self.closed.wait(self.flush_interval):
+      self.flush()
+
+  def close(self):
+    if self.closed.is_set():
+      return
+    self.closed.set()
+    if self.flush_thread is not None:
+      self.flush_thread.join()
+    with self.lock:
+      self.flush_buffer()
+      self.file.close()
+    atexit.unregister(self.close)
 
 class DummySensor: 
-  def __init__(self):
+  def __init__(self, generator=None, log_writer=None):
+    self.generator = generator or default_generator
+    self.log_writer = log_writer
     self.env_values = {
       'mars_base_internal_temperature': 0,
       'mars_base_external_temperature': 0,
@@ -30,34 +209,39 @@ class DummySensor:
     }
   
   def set_env(self):
-    self.env_values['mars_base_internal_temperature'] = get_random_number(18,30)
-    self.env_values['mars_base_external_temperature'] = get_random_number(0,21)
-    self.env_values['mars_base_internal_humidity'] = get_random_number(50, 60)
-    self.env_values['mars_base_external_illuminance'] = get_random_number(500, 715)
-    self.env_values['mars_base_internal_co2'] = get_random_number(0.02, 0.1)
-    # self.env_values['mars_base_internal_oxygen'] = get_random_number(4, 7)
-    self.env_values["mars_base_internal_oxygen"] = random.uniform(4, 7)
+    self.env_values['mars_base_internal_temperature'] = self.generator.random_number(18,30)
+    self.env_values['mars_base_external_temperature'] = self.generator.random_number(0,21)
+    self.env_values['mars_base_internal_humidity'] = self.generator.random_number(50, 60)
+    self.env_values['mars_base_external_illuminance'] = self.generator.random_number(500, 715)
+    self.env_values['mars_base_internal_co2'] = self.generator.random_number(0.02, 0.1)
+    self.env_values["mars_base_internal_oxygen"] = self.generator.uniform(4, 7)
+
+  # count 개의 샘플을 한 번에 생성 (센서마다 길이 count 인 numpy 배열)
+  def generate_env_batch(self, count, seed=None):
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    batch = {}
+    for key, (low, high, kind) in ENV_RANGES.items():
+      if kind is int:
+        batch[key] = rng.integers(low, high, size=count, endpoint=True)
+      else:
+        batch[key] = rng.uniform(low, high, size=count)
+    return batch
 
   def get_env(self):
     self.log_env_data()
     return self.env_values
 
   def log_env_data(self):
-    log_filename = "logs/mars_base_log.txt"
-    current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-      
-    with open(log_filename, "a") as log_file:
-      log_file.write(f"{current_time} - ")
-      log_file.write(f"Internal Temperature: {self.env_values['mars_base_internal_temperature']:.2f} °C, ")
-      log_file.write(f"External Temperature: {self.env_values['mars_base_external_temperature']:.2f} °C, ")
-      log_file.write(f"Internal Humidity: {self.env_values['mars_base_internal_humidity']:.2f} %, ")
-      log_file.write(f"External Illuminance: {self.env_values['mars_base_external_illuminance']:.2f} W/m2, ")
-      log_file.write(f"Internal CO2: {self.env_values['mars_base_internal_co2']:.2f} %, ")
-      log_file.write(f"Internal Oxygen: {self.env_values['mars_base_internal_oxygen']:.2f} %\n")
-
-ds = DummySensor()
-
-ds.set_env()
-env_data = ds.get_env()
-
-print(env_data)
\ No newline at end of file
+    # 기록기는 처음 기록할 때 한 번만 열고 계속 사용
+    if self.log_writer is None:
+      self.log_writer = SensorLogWriter(LOG_FILENAME)
+    self.log_writer.write(self.env_values)
+
+if __name__ == '__main__':
+  ds = DummySensor()
+
+  ds.set_env()
+  env_data = ds.get_env()
+
+  print(env_data)
@@ -0,0 +1,185 @@
+import os
+import re
+import math
+import struct
+import argparse
+import calendar
+from array import array
+from bisect import bisect_right
+
+from mars_mission_computer import LOG_FILENAME, LOG_KEYS
+
+# "2025-03-27 23:29:34 - Internal Temperature: 23.00 °C, ..." 한 줄에서 시간과 센서 값 6개를 꺼냄
+# 단위(°C 등)는 인코딩이 제각각이라 숫자 뒤 쉼표까지는 건너뜀
+SENSOR_LINE = re.compile(
+  rb'^(\d{4}-\d\d-\d\d) (\d\d):(\d\d):(\d\d) - '
+  rb'Internal Temperature: (-?[\d.]+)[^,\n]*, '
+  rb'External Temperature: (-?[\d.]+)[^,\n]*, '
+  rb'Internal Humidity: (-?[\d.]+)[^,\n]*, '
+  rb'External Illuminance: (-?[\d.]+)[^,\n]*, '
+  rb'Internal CO2: (-?[\d.]+)[^,\n]*, '
+  rb'Internal Oxygen: (-?[\d.]+)[^\n]*\n',
+  re.MULTILINE
+)
+BLOCK_SIZE = 1024 * 1024
+
+# 인덱스 파일 구조 (little-endian)
+#   헤더: magic(4) = b'SLIX', version(u16), stride(u16), indexed_size(u64), line_count(u64)
+#   항목: (epoch 초 int64, 바이트 위치 int64) x N  -- stride 줄마다 하나씩
+# indexed_size 는 인덱스가 반영한 로그 크기이며, 로그가 늘어나면 그 뒤만 읽어서 항목을 이어 붙임
+# 로그는 시간순으로 추가된다고 가정함
+INDEX_MAGIC = b'SLIX'
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct('<4sHHQQ')
+INDEX_STRIDE = 256
+
+day_epoch_cache = {}
+
+# 날짜(b'YYYY-MM-DD')와 시분초로 epoch 초 계산 (날짜 부분은 한 번만 계산해서 재사용)
+def day_to_epoch(day, hour, minute, second):
+  day_epoch = day_epoch_cache.get(day)
+  if day_epoch is None:
+    day_epoch = calendar.timegm((int(day[:4]), int(day[5:7]), int(day[8:10]), 0, 0, 0))
+    day_epoch_cache[day] = day_epoch
+  return day_epoch + int(hour) * 3600 + int(minute) * 60 + int(second)
+
+# 'YYYY-MM-DD HH:MM:SS' 문자열을 epoch 초로 변환
+def timestamp_to_epoch(timestamp):
+  return day_to_epoch(timestamp[:10].encode(), timestamp[11:13], timestamp[14:16], timestamp[17:19])
+
+# 센서 값을 열 단위로 저장 (epoch 는 array('q'), 센서마다 array('d'))
+class SensorColumns:
+  def __init__(self):
+    self.epoch = array('q')
+    self.values = {key: array('d') for key in LOG_KEYS}
+
+  def __len__(self):
+    return len(self.epoch)
+
+  def append(self, epoch, values):
+    self.epoch.append(epoch)
+    for key, value in zip(LOG_KEYS, values):
+      self.values[key].append(value)
+
+  # 센서별 개수, 평균, 최소, 최대, 표준편차
+  def statistics(self):
+    stats = {}
+    for key, column in self.values.items():
+      count = len(column)
+      if count == 0:
+        stats[key] = {'count': 0, 'mean': None, 'min': None, 'max': None, 'std': None}
+        continue
+      mean = math.fsum(column) / count
+      variance = math.fsum((value - mean) ** 2 for value in column) / count
+      stats[key] = {
+        'count': count,
+        'mean': mean,
+        'min': min(column),
+        'max': max(column),
+        'std': math.sqrt(variance)
+      }
+    return stats
+
+# offset 부터 블록 단위로 읽으면서 (바이트 위치, 매치) 를 넘겨줌 (끝이 잘린 마지막 줄은 제외)
+def iter_sensor_matches(file, offset=0, block_size=BLOCK_SIZE):
+  file.seek(offset)
+  remainder = b''
+  while True:
+    block = file.read(block_size)
+    if not block:
+      break
+    block = remainder + block
+    cut = block.rfind(b'\n') + 1
+    remainder = block[cut:]
+    for match in SENSOR_LINE.finditer(block, 0, cut):
+      yield offset + match.start(), match
+    offset += cut
+
+def match_to_record(match):
+  groups = match.groups()
+  return day_to_epoch(*groups[:4]), [float(value) for value in groups[4:]]
+
+# 로그를 열 단위 배열로 읽기 (offset 부터, start 이상 end 이하 시간만)
+def parse_sensor_log(file_path=LOG_FILENAME, offset=0, start=None, end=None):
+  start_epoch = timestamp_to_epoch(start) if start else None
+  end_epoch = timestamp_to_epoch(end) if end else None
+  columns = SensorColumns()
+  with open(file_path, 'rb') as file:
+    for _, match in iter_sensor_matches(file, offset):
+      epoch, values = match_to_record(match)
+      if start_epoch is not None and epoch < start_epoch:
+        continue
+      if end_epoch is not None and epoch > end_epoch:
+        break
+      columns.append(epoch, values)
+  return columns
+
+def index_path(file_path):
+  return file_path + '.idx'
+
+def read_sensor_index(index_file):
+  try:
+    with open(index_file, 'rb') as file:
+      magic, version, stride, indexed_size, line_count = INDEX_HEADER.unpack(file.read(INDEX_HEADER.size))
+      if magic != INDEX_MAGIC or version != INDEX_VERSION:
+        return None
+      entries = array('q')
+      entries.frombytes(file.read())
+      return stride, indexed_size, line_count, entries
+  except (FileNotFoundError, struct.error):
+    return None
+
+# 인덱스를 로그에 맞게 갱신 (새로 추가된 부분만 읽음) 후 (epoch 배열, 위치 배열) 반환
+def update_sensor_index(file_path=LOG_FILENAME, index_file=None, stride=INDEX_STRIDE):
+  if index_file is None:
+    index_file = index_path(file_path)
+
+  index = read_sensor_index(index_file)
+  log_size = os.path.getsize(file_path)
+  # 인덱스가 없거나, 설정이 다르거나, 로그가 줄어들었으면 처음부터 다시 만듦
+  if index is None or index[0] != stride or index[1] > log_size:
+    index = (stride, 0, 0, array('q'))
+  _, indexed_size, line_count, entries = index
+
+  if indexed_size < log_size:
+    new_entries = array('q')
+    with open(file_path, 'rb') as file:
+      for offset, match in iter_sensor_matches(file, indexed_size):
+        if line_count % stride == 0:
+          new_entries.append(match_to_record(match)[0])
+          new_entries.append(offset)
+        line_count += 1
+        indexed_size = offset + len(match.group(0))
+
+    with open(index_file, 'r+b' if entries else 'wb') as file:
+      file.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, stride, indexed_size, line_count))
+      file.seek(0, 2)
+      new_entries.tofile(file)
+    entries.extend(new_entries)
+
+  return entries[0::2], entries[1::2]
+
+# 인덱스로 시작 위치를 찾은 뒤 시간 범위 안의 측정값만 읽기
+def query_sensor_log(file_path=LOG_FILENAME, start=None, end=None, index_file=None):
+  epochs, offsets = update_sensor_index(file_path, index_file)
+  offset = 0
+  if start and epochs:
+    # start 보다 앞선 마지막 항목부터 읽기 시작
+    position = bisect_right(epochs, timestamp_to_epoch(start) - 1) - 1
+    if position >= 0:
+      offset = offsets[position]
+  return parse_sensor_log(file_path, offset, start, end)
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Mars base sensor log statistics')
+  parser.add_argument('--log', default=LOG_FILENAME)
+  parser.add_argument('--start', help="'YYYY-MM-DD HH:MM:SS'")
+  parser.add_argument('--end', help="'YYYY-MM-DD HH:MM:SS'")
+  args = parser.parse_args()
+
+  columns = query_sensor_log(args.log, args.start, args.end)
+  print(f'{len(columns)} readings')
+  for key, stats in columns.statistics().items():
+    if stats['count']:
+      print(f"{key}: mean {stats['mean']:.2f}, min {stats['min']:.2f}, max {stats['max']:.2f}, std {stats['std']:.2f}")
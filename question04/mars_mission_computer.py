@@ -1,6 +1,9 @@
 import random
 import time
 import json
+import math
+from array import array
+from collections import deque
 
 class DummySensor:
   def __init__(self):
@@ -24,15 +27,159 @@ class DummySensor:
   def get_env(self):
     return self.env_values
 
+SAMPLE_INTERVAL = 5  # 측정 주기 (초)
+# 이름별 평균 구간 (초)
+AVERAGE_WINDOWS = {
+  "1min": 60,
+  "5min": 300,
+  "1h": 3600
+}
+
+# 최근 size 개 값의 평균/분산/최소/최대를 값이 들어올 때마다 O(1)에 갱신
+# (평균/분산은 Welford 방식, 최소/최대는 단조 deque 사용)
+class WindowStats:
+  def __init__(self, size):
+    self.size = size
+    self.count = 0
+    self.mean = 0.0
+    self.m2 = 0.0
+    self.min_candidates = deque()
+    self.max_candidates = deque()
+
+  # sequence 번째 값 value 추가, evicted 는 구간에서 빠지는 값 (구간이 아직 안 찼으면 None)
+  def push(self, sequence, value, evicted):
+    if evicted is None:
+      self.count += 1
+      delta = value - self.mean
+      self.mean += delta / self.count
+      self.m2 += delta * (value - self.mean)
+    else:
+      old_mean = self.mean
+      self.mean += (value - evicted) / self.count
+      self.m2 += (value - evicted) * (value - self.mean + evicted - old_mean)
+
+    oldest = sequence - self.size
+    while self.min_candidates and self.min_candidates[-1][1] >= value:
+      self.min_candidates.pop()
+    self.min_candidates.append((sequence, value))
+    if self.min_candidates[0][0] <= oldest:
+      self.min_candidates.popleft()
+
+    while self.max_candidates and self.max_candidates[-1][1] <= value:
+      self.max_candidates.pop()
+    self.max_candidates.append((sequence, value))
+    if self.max_candidates[0][0] <= oldest:
+      self.max_candidates.popleft()
+
+  def summary(self):
+    if self.count == 0:
+      return {"count": 0, "mean": 0.0, "min": 0.0, "max": 0.0, "stddev": 0.0}
+    return {
+      "count": self.count,
+      "mean": self.mean,
+      "min": self.min_candidates[0][1],
+      "max": self.max_candidates[0][1],
+      "stddev": math.sqrt(max(self.m2, 0.0) / self.count)
+    }
+
+# 센서 하나의 값을 고정 크기 배열에 돌려 가며 저장하는 링 버퍼
+# 가장 긴 구간만큼만 저장하고, 짧은 구간들도 같은 버퍼에서 빠지는 값을 꺼내서 통계를 갱신
+class SensorRingBuffer:
+  def __init__(self, windows):
+    self.capacity = max(windows.values())
+    self.values = array("d", [0.0]) * self.capacity
+    self.total = 0
+    self.windows = {name: WindowStats(size) for name, size in windows.items()}
+
+  def push(self, value):
+    sequence = self.total
+    for stats in self.windows.values():
+      evicted = None
+      if sequence >= stats.size:
+        evicted = self.values[(sequence - stats.size) % self.capacity]
+      stats.push(sequence, value, evicted)
+    self.values[sequence % self.capacity] = value
+    self.total += 1
+
+  def summary(self, window):
+    return self.windows[window].summary()
+
+# 주기의 정확한 경계(벽시계 기준 period 의 배수)마다 깨어나는 스케줄러
+# 작업 시간과 상관없이 다음 경계까지만 자므로 주기가 밀리지 않고,
+# 틱마다 예정 시각 대비 지연(latency)과 직전 틱과의 지연 차이(jitter)를 기록함
+class PeriodicScheduler:
+  def __init__(self, period, clock=time.monotonic, sleep=time.sleep):
+    self.period = period
+    self.clock = clock
+    self.sleep = sleep
+    # 단조 시계로 재되, 첫 경계는 벽시계에서 period 의 배수가 되는 시각으로 맞춤
+    wall_now = time.time()
+    self.next_wall = (wall_now // period + 1) * period
+    self.next_deadline = self.clock() + (self.next_wall - wall_now)
+    self.ticks = 0
+    self.missed = 0
+    self.last_latency = None
+    self.latency_sum = 0.0
+    self.latency_max = 0.0
+    self.jitter_sum = 0.0
+    self.jitter_max = 0.0
+
+  # 다음 경계까지 기다린 뒤 그 경계의 벽시계 시각 반환
+  def wait(self):
+    remaining = self.next_deadline - self.clock()
+    if remaining > 0:
+      self.sleep(remaining)
+    now = self.clock()
+
+    # 한 주기 이상 늦었으면 지나간 경계는 건너뛰고 가장 최근 경계로 맞춤
+    late_periods = int((now - self.next_deadline) // self.period)
+    if late_periods > 0:
+      self.missed += late_periods
+      self.next_deadline += late_periods * self.period
+      self.next_wall += late_periods * self.period
+
+    latency = now - self.next_deadline
+    self.latency_sum += latency
+    self.latency_max = max(self.latency_max, latency)
+    if self.last_latency is not None:
+      jitter = abs(latency - self.last_latency)
+      self.jitter_sum += jitter
+      self.jitter_max = max(self.jitter_max, jitter)
+    self.last_latency = latency
+    self.ticks += 1
+
+    tick_wall = self.next_wall
+    self.next_deadline += self.period
+    self.next_wall += self.period
+    return tick_wall
+
+  def stats(self):
+    return {
+      "ticks": self.ticks,
+      "missed_ticks": self.missed,
+      "latency_last": self.last_latency or 0.0,
+      "latency_mean": self.latency_sum / self.ticks if self.ticks else 0.0,
+      "latency_max": self.latency_max,
+      "jitter_mean": self.jitter_sum / (self.ticks - 1) if self.ticks > 1 else 0.0,
+      "jitter_max": self.jitter_max
+    }
+
 class MissionComputer:
   def __init__(self, sensor):
     self.env_values = {}
     self.sensor = sensor
-    self.history = []
+    # 센서마다 링 버퍼 하나 (구간 크기는 측정 횟수 단위)
+    self.windows = {name: max(1, int(seconds // SAMPLE_INTERVAL)) for name, seconds in AVERAGE_WINDOWS.items()}
+    self.buffers = {}
+    self.sample_count = 0
     self.stop_flag = False
+    self.scheduler = None
 
   def get_sensor_data(self):
+    # 5초 경계마다 측정 (작업 시간만큼 밀리지 않음)
+    self.scheduler = PeriodicScheduler(SAMPLE_INTERVAL)
     while not self.stop_flag:
+      tick_time = self.scheduler.wait()
       self.sensor.set_env()
       self.env_values = self.sensor.get_env()
 
@@ -40,49 +187,54 @@ class MissionComputer:
       print("Current Sensor Data:")
       print(json.dumps(self.env_values, indent=4))
 
-      # 5분 평균 출력
-      self.history.append(self.env_values)
-      if len(self.history) == 60: 
-        self.print_avg_data()
-        self.history = []
+      # 값만 링 버퍼에 넣음 (dict 자체를 보관하지 않음)
+      self.record_env_values(self.env_values)
 
-      # 5초마다 반복
-      time.sleep(5)
+      # 벽시계 5분 경계마다 5분 평균 출력
+      if round(tick_time) % AVERAGE_WINDOWS["5min"] == 0:
+        self.print_avg_data()
 
       # 사용자 입력 확인
       if self.stop_flag:
         break
 
-  def print_avg_data(self):
-    avg_values = {
-      "mars_base_internal_temperature": 0.0,
-      "mars_base_external_temperature": 0.0,
-      "mars_base_internal_humidity": 0.0,
-      "mars_base_external_illuminance": 0.0,
-      "mars_base_internal_co2": 0.0,
-      "mars_base_internal_oxygen": 0.0
-    }
+  # 측정 주기 지연/지터 통계 (초)
+  def get_schedule_stats(self):
+    if self.scheduler is None:
+      return {}
+    return self.scheduler.stats()
+
+  def record_env_values(self, env_values):
+    for key, value in env_values.items():
+      buffer = self.buffers.get(key)
+      if buffer is None:
+        buffer = self.buffers[key] = SensorRingBuffer(self.windows)
+      buffer.push(value)
+    self.sample_count += 1
 
-    for entry in self.history:
-      for key in avg_values:
-        avg_values[key] += entry[key]
+  # 구간(1min, 5min, 1h) 안의 센서별 평균/최소/최대/표준편차
+  def get_window_stats(self, window="5min"):
+    return {key: buffer.summary(window) for key, buffer in self.buffers.items()}
 
-    # 평균 계산
-    for key in avg_values:
-      avg_values[key] /= len(self.history)
+  def print_avg_data(self, window="5min"):
+    avg_values = {key: stats["mean"] for key, stats in self.get_window_stats(window).items()}
 
-    print("5-Minute Average Sensor Data:")
+    print("5-Minute Average Sensor Data:" if window == "5min" else f"{window} Average Sensor Data:")
     print(json.dumps(avg_values, indent=4))
 
   def stop(self):
     self.stop_flag = True
+    if self.scheduler is not None:
+      print("Sampling Schedule Stats:")
+      print(json.dumps(self.get_schedule_stats(), indent=4))
     print("System stopped...")
 
-ds = DummySensor()
-RunComputer = MissionComputer(ds)
+if __name__ == '__main__':
+  ds = DummySensor()
+  RunComputer = MissionComputer(ds)
 
-try:
-  RunComputer.get_sensor_data()
-except KeyboardInterrupt:
-  # Ctrl+C 입력 시 stop 메소드 호출출
-  RunComputer.stop()
+  try:
+    RunComputer.get_sensor_data()
+  except KeyboardInterrupt:
+    # Ctrl+C 입력 시 stop 메소드 호출출
+    RunComputer.stop()
@@ -0,0 +1,148 @@
+import time
+import math
+import random
+import argparse
+import multiprocessing
+from multiprocessing import shared_memory
+
+from mars_mission_computer import ENV_RANGES, DummySensor
+
+SENSOR_KEYS = list(ENV_RANGES)
+# 공유 메모리 구조: 가상 센서마다 한 줄 = [순번, epoch, 센서 값 x 6] (float64)
+# 순번은 쓰는 동안 홀수, 다 쓰면 짝수 (읽는 쪽은 순번이 짝수이고 읽기 전후로 같을 때만 값을 사용)
+# 순번 / 2 가 그 센서가 지금까지 쓴 측정 횟수
+ROW_SIZE = 2 + len(SENSOR_KEYS)
+REPORT_INTERVAL = 1.0
+
+# 작업 프로세스: 맡은 줄(first_row 부터 sensor_count 개)의 가상 센서를 interval 초마다 읽어서 공유 메모리에 씀
+# 측정값은 공유 메모리에 바로 쓰므로 프로세스 사이에 pickle 되는 값이 없음
+def run_worker(shm_name, first_row, sensor_count, interval, stop_event, seed):
+  random.seed(seed)
+  shm = shared_memory.SharedMemory(name=shm_name)
+  rows = shm.buf.cast('d')
+  try:
+    sensors = [DummySensor() for _ in range(sensor_count)]
+    next_time = time.monotonic()
+    while not stop_event.is_set():
+      epoch = time.time()
+      base = first_row * ROW_SIZE
+      for sensor in sensors:
+        sensor.set_env()
+        env_values = sensor.get_env()
+        rows[base] += 1
+        rows[base + 1] = epoch
+        for i, key in enumerate(SENSOR_KEYS, base + 2):
+          rows[i] = env_values[key]
+        rows[base] += 1
+        base += ROW_SIZE
+      if interval > 0:
+        next_time += interval
+        stop_event.wait(max(0.0, next_time - time.monotonic()))
+  except KeyboardInterrupt:
+    pass  # Ctrl+C 는 부모 프로세스가 처리 (stop_event 로 종료)
+  finally:
+    rows.release()
+    shm.close()
+
+# 집계: 모든 줄의 최신 값으로 전체 평균/최소/최대와 누적 측정 횟수 계산
+# 쓰는 중인 줄은 몇 번 다시 읽고, 그래도 안 되면 이번 집계에서 제외
+def aggregate_fleet(rows, row_count, retries=3):
+  sums = [0.0] * len(SENSOR_KEYS)
+  minimums = [math.inf] * len(SENSOR_KEYS)
+  maximums = [-math.inf] * len(SENSOR_KEYS)
+  sensor_count = 0
+  reading_count = 0
+  for row in range(row_count):
+    base = row * ROW_SIZE
+    for _ in range(retries):
+      sequence = rows[base]
+      if sequence % 2:
+        continue
+      values = rows[base + 2:base + ROW_SIZE].tolist()
+      if rows[base] == sequence:
+        break
+    else:
+      continue
+    if sequence == 0:
+      continue
+    sensor_count += 1
+    reading_count += int(sequence) // 2
+    for i, value in enumerate(values):
+      sums[i] += value
+      if value < minimums[i]:
+        minimums[i] = value
+      if value > maximums[i]:
+        maximums[i] = value
+
+  stats = {"sensors": sensor_count, "readings": reading_count}
+  for i, key in enumerate(SENSOR_KEYS):
+    if sensor_count:
+      stats[key] = {"mean": sums[i] / sensor_count, "min": minimums[i], "max": maximums[i]}
+    else:
+      stats[key] = {"mean": None, "min": None, "max": None}
+  return stats
+
+# workers 개 프로세스가 각각 sensors_per_worker 개의 가상 센서를 돌리고, 이 프로세스가 report_interval 초마다 집계
+# duration 초 뒤 (None 이면 Ctrl+C 까지) 종료하고 마지막 집계 결과를 반환
+def simulate_fleet(workers, sensors_per_worker, interval=1.0, duration=None, report_interval=REPORT_INTERVAL, report=print):
+  row_count = workers * sensors_per_worker
+  shm = shared_memory.SharedMemory(create=True, size=row_count * ROW_SIZE * 8)
+  shm.buf[:] = bytes(len(shm.buf))  # 순번 0 = 아직 쓰지 않은 줄
+  rows = shm.buf.cast('d')
+  stop_event = multiprocessing.Event()
+  processes = [
+    multiprocessing.Process(
+      target=run_worker,
+      args=(shm.name, worker * sensors_per_worker, sensors_per_worker, interval, stop_event, worker),
+      name=f"fleet-worker-{worker}",
+      daemon=True
+    )
+    for worker in range(workers)
+  ]
+  start = time.monotonic()
+  for process in processes:
+    process.start()
+  try:
+    previous_readings = 0
+    previous_time = start
+    while duration is None or time.monotonic() - start < duration:
+      wait = report_interval if duration is None else min(report_interval, start + duration - time.monotonic())
+      time.sleep(max(0.0, wait))
+      now = time.monotonic()
+      stats = aggregate_fleet(rows, row_count)
+      stats["readings_per_second"] = (stats["readings"] - previous_readings) / (now - previous_time)
+      previous_readings, previous_time = stats["readings"], now
+      if report is not None:
+        report(stats)
+  except KeyboardInterrupt:
+    pass
+  finally:
+    stop_event.set()
+    for process in processes:
+      process.join()
+    stats = aggregate_fleet(rows, row_count)
+    stats["readings_per_second"] = stats["readings"] / (time.monotonic() - start)
+    rows.release()
+    shm.close()
+    shm.unlink()
+  return stats
+
+def print_fleet_stats(stats):
+  means = ", ".join(
+    f"{key[len('mars_base_'):]} {stats[key]['mean']:.2f}" for key in SENSOR_KEYS if stats[key]["mean"] is not None
+  )
+  print(f"{stats['sensors']} sensors, {stats['readings']:,} readings ({stats['readings_per_second']:,.0f}/s): {means}")
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Mars sensor fleet simulator')
+  parser.add_argument('--workers', type=int, default=multiprocessing.cpu_count())
+  parser.add_argument('--sensors', type=int, default=1000, help='작업 프로세스 하나가 돌리는 가상 센서 수')
+  parser.add_argument('--interval', type=float, default=1.0, help='센서 측정 주기 (초, 0이면 쉬지 않고 측정)')
+  parser.add_argument('--duration', type=float, default=None, help='실행 시간 (초, 없으면 Ctrl+C 까지)')
+  parser.add_argument('--report-interval', type=float, default=REPORT_INTERVAL)
+  args = parser.parse_args()
+
+  final = simulate_fleet(args.workers, args.sensors, args.interval, args.duration, args.report_interval, print_fleet_stats)
+  print('--- final ---')
+  print_fleet_stats(final)
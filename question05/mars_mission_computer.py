@@ -1,8 +1,27 @@
 import random
 import time
+import asyncio
+import argparse
 import json
+import math
+from array import array
+from collections import deque
 import os
+import sys
 import platform
+import threading
+
+from telemetry_output import SINKS, PrettyJsonSink, open_sink
+
+# 센서별 값 범위
+ENV_RANGES = {
+  "mars_base_internal_temperature": (18, 30),
+  "mars_base_external_temperature": (0, 21),
+  "mars_base_internal_humidity": (50, 60),
+  "mars_base_external_illuminance": (500, 715),
+  "mars_base_internal_co2": (0.02, 0.1),
+  "mars_base_internal_oxygen": (4, 7)
+}
 
 class DummySensor:
   def __init__(self):
@@ -15,37 +34,474 @@ class DummySensor:
       "mars_base_internal_oxygen": 0.0
     }
 
-  def set_env(self):
-    self.env_values["mars_base_internal_temperature"] = random.uniform(18, 30)
-    self.env_values["mars_base_external_temperature"] = random.uniform(0, 21)
-    self.env_values["mars_base_internal_humidity"] = random.uniform(50, 60)
-    self.env_values["mars_base_external_illuminance"] = random.uniform(500, 715)
-    self.env_values["mars_base_internal_co2"] = random.uniform(0.02, 0.1)
-    self.env_values["mars_base_internal_oxygen"] = random.uniform(4, 7)
+  # keys 를 주면 그 센서 값만 새로 측정 (빈 목록이면 아무것도 측정하지 않음)
+  def set_env(self, keys=None):
+    for key in ENV_RANGES if keys is None else keys:
+      low, high = ENV_RANGES[key]
+      self.env_values[key] = random.uniform(low, high)
 
   def get_env(self):
     return self.env_values
 
+SAMPLE_INTERVAL = 5  # 측정 주기 (초)
+# 이름별 평균 구간 (초)
+AVERAGE_WINDOWS = {
+  "1min": 60,
+  "5min": 300,
+  "1h": 3600
+}
+
+# 최근 size 개 값의 평균/분산/최소/최대를 값이 들어올 때마다 O(1)에 갱신
+# (평균/분산은 Welford 방식, 최소/최대는 단조 deque 사용)
+class WindowStats:
+  def __init__(self, size):
+    self.size = size
+    self.count = 0
+    self.mean = 0.0
+    self.m2 = 0.0
+    self.min_candidates = deque()
+    self.max_candidates = deque()
+
+  # sequence 번째 값 value 추가, evicted 는 구간에서 빠지는 값 (구간이 아직 안 찼으면 None)
+  def push(self, sequence, value, evicted):
+    if evicted is None:
+      self.count += 1
+      delta = value - self.mean
+      self.mean += delta / self.count
+      self.m2 += delta * (value - self.mean)
+    else:
+      old_mean = self.mean
+      self.mean += (value - evicted) / self.count
+      self.m2 += (value - evicted) * (value - self.mean + evicted - old_mean)
+
+    oldest = sequence - self.size
+    while self.min_candidates and self.min_candidates[-1][1] >= value:
+      self.min_candidates.pop()
+    self.min_candidates.append((sequence, value))
+    if self.min_candidates[0][0] <= oldest:
+      self.min_candidates.popleft()
+
+    while self.max_candidates and self.max_candidates[-1][1] <= value:
+      self.max_candidates.pop()
+    self.max_candidates.append((sequence, value))
+    if self.max_candidates[0][0] <= oldest:
+      self.max_candidates.popleft()
+
+  def summary(self):
+    if self.count == 0:
+      return {"count": 0, "mean": 0.0, "min": 0.0, "max": 0.0, "stddev": 0.0}
+    return {
+      "count": self.count,
+      "mean": self.mean,
+      "min": self.min_candidates[0][1],
+      "max": self.max_candidates[0][1],
+      "stddev": math.sqrt(max(self.m2, 0.0) / self.count)
+    }
+
+# 센서 하나의 값을 고정 크기 배열에 돌려 가며 저장하는 링 버퍼
+# 가장 긴 구간만큼만 저장하고, 짧은 구간들도 같은 버퍼에서 빠지는 값을 꺼내서 통계를 갱신
+class SensorRingBuffer:
+  def __init__(self, windows):
+    self.capacity = max(windows.values())
+    self.values = array("d", [0.0]) * self.capacity
+    self.total = 0
+    self.windows = {name: WindowStats(size) for name, size in windows.items()}
+
+  def push(self, value):
+    sequence = self.total
+    for stats in self.windows.values():
+      evicted = None
+      if sequence >= stats.size:
+        evicted = self.values[(sequence - stats.size) % self.capacity]
+      stats.push(sequence, value, evicted)
+    self.values[sequence % self.capacity] = value
+    self.total += 1
+
+  def summary(self, window):
+    return self.windows[window].summary()
+
+# 주기의 정확한 경계(벽시계 기준 period 의 배수)마다 깨어나는 스케줄러
+# 작업 시간과 상관없이 다음 경계까지만 자므로 주기가 밀리지 않고,
+# 틱마다 예정 시각 대비 지연(latency)과 직전 틱과의 지연 차이(jitter)를 기록함
+class PeriodicScheduler:
+  def __init__(self, period, clock=time.monotonic, sleep=time.sleep):
+    self.period = period
+    self.clock = clock
+    self.sleep = sleep
+    # 단조 시계로 재되, 첫 경계는 벽시계에서 period 의 배수가 되는 시각으로 맞춤
+    wall_now = time.time()
+    self.next_wall = (wall_now // period + 1) * period
+    self.next_deadline = self.clock() + (self.next_wall - wall_now)
+    self.ticks = 0
+    self.missed = 0
+    self.last_latency = None
+    self.latency_sum = 0.0
+    self.latency_max = 0.0
+    self.jitter_sum = 0.0
+    self.jitter_max = 0.0
+
+  # 주기를 바꾸고 다음 틱을 새 주기의 경계에 맞춤 (지연/지터 통계는 유지)
+  def set_period(self, period):
+    wall_now = time.time()
+    self.period = period
+    self.next_wall = (wall_now // period + 1) * period
+    self.next_deadline = self.clock() + (self.next_wall - wall_now)
+    self.last_latency = None
+
+  # 다음 경계까지 기다린 뒤 그 경계의 벽시계 시각 반환
+  def wait(self):
+    remaining = self.next_deadline - self.clock()
+    if remaining > 0:
+      self.sleep(remaining)
+    now = self.clock()
+
+    # 한 주기 이상 늦었으면 지나간 경계는 건너뛰고 가장 최근 경계로 맞춤
+    late_periods = int((now - self.next_deadline) // self.period)
+    if late_periods > 0:
+      self.missed += late_periods
+      self.next_deadline += late_periods * self.period
+      self.next_wall += late_periods * self.period
+
+    latency = now - self.next_deadline
+    self.latency_sum += latency
+    self.latency_max = max(self.latency_max, latency)
+    if self.last_latency is not None:
+      jitter = abs(latency - self.last_latency)
+      self.jitter_sum += jitter
+      self.jitter_max = max(self.jitter_max, jitter)
+    self.last_latency = latency
+    self.ticks += 1
+
+    tick_wall = self.next_wall
+    self.next_deadline += self.period
+    self.next_wall += self.period
+    return tick_wall
+
+  def stats(self):
+    return {
+      "ticks": self.ticks,
+      "missed_ticks": self.missed,
+      "latency_last": self.last_latency or 0.0,
+      "latency_mean": self.latency_sum / self.ticks if self.ticks else 0.0,
+      "latency_max": self.latency_max,
+      "jitter_mean": self.jitter_sum / (self.ticks - 1) if self.ticks > 1 else 0.0,
+      "jitter_max": self.jitter_max
+    }
+
+# /proc/stat 을 interval 초마다 읽어서 직전 구간의 CPU 사용률(전체, 코어별)을 계산해 두는 백그라운드 샘플러
+# get_mission_computer_load 는 계산된 값만 꺼내므로 기다리지 않음 (Linux 전용)
+class CpuUsageSampler:
+  def __init__(self, interval=1.0, proc_stat="/proc/stat"):
+    self.interval = interval
+    self.proc_stat = proc_stat
+    self.previous = None
+    self.usage = {}
+    self.lock = threading.Lock()
+    self.stop_event = threading.Event()
+    self.thread = None
+
+  # {"cpu": (전체 시간, 유휴 시간), "cpu0": ...}
+  def read_times(self):
+    times = {}
+    with open(self.proc_stat, "r") as file:
+      for line in file:
+        if not line.startswith("cpu"):
+          break
+        fields = line.split()
+        # user nice system idle iowait irq softirq steal (guest 는 user 에 이미 포함)
+        values = [int(value) for value in fields[1:9]]
+        times[fields[0]] = (sum(values), values[3] + values[4])
+    return times
+
+  # 첫 샘플은 부팅 이후 평균, 그 다음부터는 직전 샘플과의 차이로 계산
+  def sample(self):
+    current = self.read_times()
+    previous = self.previous or {}
+    usage = {}
+    for name, (total, idle) in current.items():
+      previous_total, previous_idle = previous.get(name, (0, 0))
+      delta_total = total - previous_total
+      delta_idle = idle - previous_idle
+      usage[name] = 100.0 * (delta_total - delta_idle) / delta_total if delta_total > 0 else 0.0
+    with self.lock:
+      self.usage = usage
+    self.previous = current
+
+  def run(self):
+    while not self.stop_event.wait(self.interval):
+      self.sample()
+
+  def start(self):
+    if self.thread is None:
+      self.sample()
+      self.thread = threading.Thread(target=self.run, name="cpu-usage-sampler", daemon=True)
+      self.thread.start()
+    return self
+
+  def stop(self):
+    self.stop_event.set()
+    if self.thread is not None:
+      self.thread.join()
+      self.thread = None
+
+  # 전체 사용률과 코어별 사용률
+  def get_usage(self):
+    with self.lock:
+      usage = self.usage
+    cores = {name: value for name, value in usage.items() if name != "cpu"}
+    return usage.get("cpu"), cores
+
+# /proc 파일 몇 개를 한 번씩만 읽어서 메모리, 부하, 디스크, 네트워크, 프로세스 정보를 모으는 수집기 (Linux 전용)
+# 마지막 결과를 저장해 두고 max_age 초 안에는 다시 읽지 않으며, 누적 카운터는 직전 수집과의 차이로 초당 값을 계산
+class SystemMetricsCollector:
+  MEMINFO_KEYS = ("MemTotal", "MemFree", "MemAvailable", "Buffers", "Cached", "SwapTotal", "SwapFree")
+  STATUS_KEYS = ("VmRSS", "VmHWM", "Threads", "voluntary_ctxt_switches", "nonvoluntary_ctxt_switches")
+  SECTOR_SIZE = 512
+
+  def __init__(self, proc="/proc"):
+    self.proc = proc
+    self.snapshot = None
+    self.collected_at = None
+    self.previous_counters = None
+    # 파티션을 빼고 실제 디스크만 합산 (loop, ram 장치 제외)
+    try:
+      self.disks = {name for name in os.listdir("/sys/block") if not name.startswith(("loop", "ram"))}
+    except OSError:
+      self.disks = None
+
+  # "키: 값 kB" 형식 파일에서 필요한 키만 읽기 (kB 값은 바이트로 변환)
+  @staticmethod
+  def read_key_values(path, keys):
+    values = {}
+    with open(path, "r") as file:
+      for line in file:
+        key, _, rest = line.partition(":")
+        if key in keys:
+          fields = rest.split()
+          value = int(fields[0])
+          values[key] = value * 1024 if fields[1:2] == ["kB"] else value
+    return values
+
+  def read_loadavg(self):
+    with open(os.path.join(self.proc, "loadavg"), "r") as file:
+      fields = file.read().split()
+    running, total = fields[3].split("/")
+    return {
+      "load_1min": float(fields[0]),
+      "load_5min": float(fields[1]),
+      "load_15min": float(fields[2]),
+      "running_processes": int(running),
+      "total_processes": int(total)
+    }
+
+  # 디스크 전체의 누적 읽기/쓰기 횟수와 바이트
+  def read_diskstats(self):
+    reads = writes = read_bytes = write_bytes = 0
+    with open(os.path.join(self.proc, "diskstats"), "r") as file:
+      for line in file:
+        fields = line.split()
+        name = fields[2]
+        if self.disks is not None and name not in self.disks:
+          continue
+        reads += int(fields[3])
+        read_bytes += int(fields[5]) * self.SECTOR_SIZE
+        writes += int(fields[7])
+        write_bytes += int(fields[9]) * self.SECTOR_SIZE
+    return {"disk_reads": reads, "disk_writes": writes, "disk_read_bytes": read_bytes, "disk_write_bytes": write_bytes}
+
+  # lo 를 제외한 네트워크 인터페이스의 누적 송수신 바이트
+  def read_net_dev(self):
+    rx_bytes = tx_bytes = 0
+    with open(os.path.join(self.proc, "net/dev"), "r") as file:
+      for line in file:
+        name, separator, rest = line.partition(":")
+        if not separator or name.strip() == "lo":
+          continue
+        fields = rest.split()
+        rx_bytes += int(fields[0])
+        tx_bytes += int(fields[8])
+    return {"net_rx_bytes": rx_bytes, "net_tx_bytes": tx_bytes}
+
+  def collect(self):
+    now = time.monotonic()
+    memory = self.read_key_values(os.path.join(self.proc, "meminfo"), self.MEMINFO_KEYS)
+    process = self.read_key_values(os.path.join(self.proc, "self/status"), self.STATUS_KEYS)
+    counters = self.read_diskstats()
+    counters.update(self.read_net_dev())
+
+    rates = {}
+    if self.previous_counters is not None and now > self.collected_at:
+      elapsed = now - self.collected_at
+      for key, value in counters.items():
+        rates[f"{key}_per_sec"] = (value - self.previous_counters[key]) / elapsed
+    self.previous_counters = counters
+    self.collected_at = now
+
+    self.snapshot = {
+      "memory": memory,
+      "memory_usage_percent": self.memory_usage_percent(memory),
+      "loadavg": self.read_loadavg(),
+      "io": counters,
+      "rates": rates,
+      "process": process
+    }
+    return self.snapshot
+
+  # 회수 가능한 캐시를 뺀 메모리 사용률 (MemAvailable 이 없는 오래된 커널은 MemFree 기준)
+  @staticmethod
+  def memory_usage_percent(memory):
+    total = memory.get("MemTotal", 0)
+    available = memory.get("MemAvailable", memory.get("MemFree", 0))
+    return (total - available) / total * 100 if total else 0.0
+
+  # /proc/meminfo 만 읽어서 메모리 사용률 계산 (다른 지표는 읽지 않음)
+  @classmethod
+  def read_memory_usage(cls, proc="/proc"):
+    memory = cls.read_key_values(os.path.join(proc, "meminfo"), ("MemTotal", "MemFree", "MemAvailable"))
+    return cls.memory_usage_percent(memory)
+
+  # 마지막 수집 후 max_age 초가 지났을 때만 다시 읽음
+  def get(self, max_age=1.0):
+    if self.snapshot is None or time.monotonic() - self.collected_at >= max_age:
+      return self.collect()
+    return self.snapshot
+
+CONFIG_FILE = "setting.txt"
+DEFAULT_CONFIG = {
+  "system_info": True,
+  "system_load": True,
+  "sample_interval": SAMPLE_INTERVAL
+}
+
+# setting.txt 를 캐시해 두고 파일이 바뀌었을 때만 다시 읽는 설정
+# 파일 상태(mtime, 크기)는 check_interval 초에 한 번만 확인하므로 매 틱 호출해도 부담이 없음
+#
+# setting.txt 형식 (한 줄에 key=value, # 뒤는 주석)
+#   system_info=true
+#   system_load=true
+#   sample_interval=5                      동기 모드 측정 주기 (초)
+#   interval.sensor_3=10                   asyncio 모드에서 센서별 측정 주기 (초)
+#   metric.mars_base_internal_co2=false    해당 지표는 측정하지 않음 (센서 값, cpu_usage_percent, system_metrics 등)
+# true/yes/on, false/no/off 는 불리언으로 읽고, metric.<이름> 은 false 또는 0 이면 꺼짐
+# 파일을 읽을 수 없거나 잘못된 줄이 있어도 측정은 멈추지 않음 (읽지 못하면 이전 설정 유지)
+class ConfigWatcher:
+  def __init__(self, path=CONFIG_FILE, defaults=None, check_interval=1.0):
+    self.path = path
+    self.defaults = dict(defaults or DEFAULT_CONFIG)
+    self.check_interval = check_interval
+    self.config = dict(self.defaults)
+    self.signature = None
+    self.last_check = None
+    self.version = 0
+
+  def parse_value(self, text):
+    lowered = text.lower()
+    if lowered in ("true", "yes", "on"):
+      return True
+    if lowered in ("false", "no", "off"):
+      return False
+    for kind in (int, float):
+      try:
+        return kind(text)
+      except ValueError:
+        pass
+    return text
+
+  # 잘못된 줄은 건너뛰고 경고만 출력
+  def parse(self):
+    config = dict(self.defaults)
+    with open(self.path, "r", encoding="utf-8") as file:
+      for number, line in enumerate(file, 1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+          continue
+        key, separator, value = line.partition("=")
+        if not separator or not key.strip():
+          print(f"Ignoring malformed line {number} in {self.path}: {line}", file=sys.stderr)
+          continue
+        config[key.strip()] = self.parse_value(value.strip())
+    return config
+
+  def get(self):
+    now = time.monotonic()
+    if self.last_check is None or now - self.last_check >= self.check_interval:
+      self.last_check = now
+      try:
+        stat = os.stat(self.path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+      except OSError:
+        signature = None
+      if signature != self.signature:
+        try:
+          self.config = self.parse() if signature else dict(self.defaults)
+          self.signature = signature
+          self.version += 1
+        except OSError:
+          pass  # 잠깐 읽을 수 없는 경우이므로 다음 확인 때 다시 시도
+        except UnicodeDecodeError as error:
+          # 파일이 다시 바뀔 때까지 이전 설정을 그대로 사용
+          print(f"Ignoring {self.path}: {error}", file=sys.stderr)
+          self.signature = signature
+    return self.config
+
+  def is_enabled(self, metric):
+    value = self.get().get(f"metric.{metric}", True)
+    return value is not False and value != 0
+
+  # 센서 이름별 주기: interval.<이름> > default > sample_interval 순으로 사용
+  def interval(self, name=None, default=None):
+    config = self.get()
+    interval = config.get(f"interval.{name}") if name else None
+    if interval is None:
+      interval = default
+    if interval is None:
+      interval = config.get("sample_interval", SAMPLE_INTERVAL)
+    return interval if isinstance(interval, (int, float)) and interval > 0 else SAMPLE_INTERVAL
+
 class MissionComputer:
-  def __init__(self, sensor):
+  def __init__(self, sensor, store=None, output=None):
     self.env_values = {}
     self.sensor = sensor
-    self.history = []
+    # 측정값을 파일로 남길 TelemetryStore (없으면 저장하지 않음)
+    self.store = store
+    # 측정값/평균 출력 형식 (telemetry_output.py, 기본값은 표준 출력에 json indent=4)
+    self.output = output if output is not None else PrettyJsonSink()
+    # 시스템 정보, 부하, 종료 메시지 등은 사람이 읽는 출력 형식일 때만 표준 출력에 섞고
+    # NDJSON/CSV/이진 출력일 때는 스트림이 깨지지 않도록 표준 에러로 보냄
+    self.diagnostics = sys.stdout if isinstance(self.output, PrettyJsonSink) else sys.stderr
+    # 센서마다 링 버퍼 하나 (구간 크기는 측정 횟수 단위)
+    self.windows = self.window_sizes(SAMPLE_INTERVAL)
+    self.buffers = {}
+    self.sample_count = 0
     self.stop_flag = False
-    self.config = self.load_config()
+    self.scheduler = None
+    self.cpu_sampler = None
+    self.metrics_collector = None
+    # asyncio 모드: 센서 이름별 링 버퍼와 종료 이벤트
+    self.sensor_buffers = {}
+    self.sensor_windows = {}
+    self.reading_count = 0
+    self.stop_event = None
+    self.config_watcher = ConfigWatcher()
+    # CPU 사용률은 샘플 사이의 차이로 계산하므로 미리 샘플러를 시작해 둠
+    # (처음 시작할 때의 값은 부팅 이후 평균이고, 한 구간이 지나야 현재 사용률이 됨)
+    if self.config_watcher.is_enabled("cpu_usage_percent") or self.config_watcher.is_enabled("cpu_core_usage_percent"):
+      self.get_cpu_sampler()
+    # 디스크/네트워크 초당 값도 직전 수집과의 차이이므로 시작할 때 한 번 수집해 둠
+    if self.config_watcher.is_enabled("system_metrics"):
+      self.get_system_metrics()
+
+  # 설정은 항상 최신 값 (파일이 바뀌었으면 다시 읽음)
+  @property
+  def config(self):
+    return self.config_watcher.get()
 
   def load_config(self):
-    config = {
-      "system_info": True,
-      "system_load": True
-    }
-    if os.path.exists("setting.txt"):
-      with open("setting.txt", "r") as file:
-        lines = file.readlines()
-        for line in lines:
-          key, value = line.strip().split('=')
-          config[key.strip()] = value.strip().lower() == 'true'
-    return config
+    return self.config_watcher.get()
+
+  # 설정에서 꺼지지 않은 센서 값 이름 목록
+  def enabled_sensor_keys(self):
+    return [key for key in ENV_RANGES if self.config_watcher.is_enabled(key)]
 
   def get_mission_computer_info(self):
     if not self.config.get("system_info", False):
@@ -59,8 +515,8 @@ class MissionComputer:
       "memory": self.get_memory_info()
     }
 
-    print("Mission Computer Info:")
-    print(json.dumps(info, indent=4))
+    print("Mission Computer Info:", file=self.diagnostics)
+    print(json.dumps(info, indent=4), file=self.diagnostics)
 
   def get_memory_info(self):
     try:
@@ -81,23 +537,55 @@ class MissionComputer:
     if not self.config.get("system_load", False):
       return
 
-    cpu_usage = self.get_cpu_usage()
-    memory_usage = self.get_memory_usage()
-
-    load_info = {
-      "cpu_usage_percent": cpu_usage,
-      "memory_usage_percent": memory_usage
+    # 꺼진 지표는 읽지도 않음
+    metrics = {
+      "cpu_usage_percent": self.get_cpu_usage,
+      "cpu_core_usage_percent": self.get_cpu_core_usage,
+      "memory_usage_percent": self.get_memory_usage,
+      "system_metrics": self.get_system_metrics
     }
-    print("Mission Computer Load Info:")
-    print(json.dumps(load_info, indent=4))
+    load_info = {}
+    for name, read_metric in metrics.items():
+      if self.config_watcher.is_enabled(name):
+        value = read_metric()
+        if value is not None:
+          load_info[name] = value
+    print("Mission Computer Load Info:", file=self.diagnostics)
+    print(json.dumps(load_info, indent=4), file=self.diagnostics)
+
+  # 샘플러는 한 번만 시작하고 이후에는 계산된 값만 꺼냄
+  def get_cpu_sampler(self):
+    if self.cpu_sampler is None and os.path.exists("/proc/stat"):
+      self.cpu_sampler = CpuUsageSampler().start()
+    return self.cpu_sampler
 
   def get_cpu_usage(self):
-    cpu_idle_before = os.times()[4]  
-    time.sleep(1) 
-    cpu_idle_after = os.times()[4]  
-    total_cpu_time = os.times()[0] + os.times()[1] + os.times()[2] + os.times()[3]  # 총 CPU 사용 시간
-    cpu_usage = (cpu_idle_before - cpu_idle_after) / total_cpu_time * 100
-    return 100 - cpu_usage  # CPU 사용량 계산
+    if platform.system() == "Windows": # 윈도우 계열
+      import psutil
+      return psutil.cpu_percent(interval=None)
+    sampler = self.get_cpu_sampler()
+    if sampler is None:
+      return "N/A"
+    usage, _ = sampler.get_usage()
+    return usage if usage is not None else "N/A"
+
+  def get_cpu_core_usage(self):
+    if platform.system() == "Windows":
+      import psutil
+      return {f"cpu{i}": value for i, value in enumerate(psutil.cpu_percent(interval=None, percpu=True))}
+    sampler = self.get_cpu_sampler()
+    if sampler is None:
+      return {}
+    _, cores = sampler.get_usage()
+    return cores
+
+  # /proc 기반 시스템 지표 (Linux 가 아니면 None), 측정 주기 안에서는 저장된 값을 재사용
+  def get_system_metrics(self):
+    if self.metrics_collector is None:
+      if not os.path.exists("/proc/meminfo"):
+        return None
+      self.metrics_collector = SystemMetricsCollector()
+    return self.metrics_collector.get(max_age=SAMPLE_INTERVAL)
 
   def get_memory_usage(self):
     if platform.system() == "Windows": # 윈도우 계열열
@@ -105,6 +593,8 @@ class MissionComputer:
       total_memory = psutil.virtual_memory().total / (1024 * 1024 * 1024)
       used_memory = (psutil.virtual_memory().total - psutil.virtual_memory().available) / (1024 * 1024 * 1024)
       return (used_memory / total_memory) * 100  # 메모리 사용량 퍼센트
+    elif platform.system() == "Linux" and os.path.exists("/proc/meminfo"):  # Linux 는 MemAvailable 기준 (회수 가능한 캐시 제외)
+      return SystemMetricsCollector.read_memory_usage()
     elif platform.system() == "Linux" or platform.system() == "Darwin":  # Linux/Unix 계열
       total_memory = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / (1024. ** 3)
       used_memory = total_memory - (os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_AVPHYS_PAGES') / (1024. ** 3))
@@ -113,59 +603,205 @@ class MissionComputer:
       return "N/A"
 
   def get_sensor_data(self):
+    # 5초 경계마다 측정 (작업 시간만큼 밀리지 않음)
+    interval = self.config_watcher.interval()
+    self.scheduler = PeriodicScheduler(interval)
+    self.reset_windows(interval)
+    average_window = None
     while not self.stop_flag:
-      self.sensor.set_env()
-      self.env_values = self.sensor.get_env()
+      tick_time = self.scheduler.wait()
 
-      print("Current Sensor Data:")
-      print(json.dumps(self.env_values, indent=4))
+      # 설정 파일에서 주기가 바뀌었으면 다음 틱부터 새 주기로 측정 (평균 구간도 다시 시작)
+      if self.config_watcher.interval() != interval:
+        interval = self.config_watcher.interval()
+        self.scheduler.set_period(interval)
+        self.reset_windows(interval)
 
-      # 5분 평균 출력
-      self.history.append(self.env_values)
-      if len(self.history) == 60:
-        self.print_avg_data()
-        self.history = []
+      # 꺼진 센서 값은 측정하지 않음
+      keys = self.enabled_sensor_keys()
+      self.sensor.set_env(keys)
+      env_values = self.sensor.get_env()
+      self.env_values = {key: env_values[key] for key in keys}
+
+      self.output.write_reading(tick_time, self.env_values)
+
+      # 시스템 지표도 측정 주기마다 갱신 (초당 값이 항상 최근 한 주기 기준이 되도록)
+      if self.metrics_collector is not None and self.config_watcher.is_enabled("system_metrics"):
+        self.metrics_collector.collect()
 
-      # 5초마다 반복
-      time.sleep(5)
+      # 값만 링 버퍼에 넣음 (dict 자체를 보관하지 않음)
+      self.record_env_values(self.env_values)
+      if self.store is not None:
+        self.store.append(tick_time, self.env_values)
+
+      # 벽시계 5분 경계를 지날 때마다 5분 평균 출력
+      # 그 시점의 부하(현재 CPU 사용률 등)도 함께 출력 (diagnostics 쪽으로)
+      window = int(tick_time // AVERAGE_WINDOWS["5min"])
+      if average_window is not None and window != average_window:
+        self.print_avg_data()
+        self.get_mission_computer_load()
+      average_window = window
 
       # 사용자 입력 확인
       if self.stop_flag:
         break
 
-  def print_avg_data(self):
-    avg_values = {
-      "mars_base_internal_temperature": 0.0,
-      "mars_base_external_temperature": 0.0,
-      "mars_base_internal_humidity": 0.0,
-      "mars_base_external_illuminance": 0.0,
-      "mars_base_internal_co2": 0.0,
-      "mars_base_internal_oxygen": 0.0
-    }
+    self.output.flush()
+    if self.store is not None:
+      self.store.close()
+
+  # 측정 주기(초)에 맞춰 평균 구간을 측정 횟수로 바꿈
+  def window_sizes(self, interval):
+    return {name: max(1, int(seconds // interval)) for name, seconds in AVERAGE_WINDOWS.items()}
+
+  def reset_windows(self, interval):
+    windows = self.window_sizes(interval)
+    if windows != self.windows:
+      self.windows = windows
+      self.buffers = {}
+
+  # 측정 주기 지연/지터 통계 (초)
+  def get_schedule_stats(self):
+    if self.scheduler is None:
+      return {}
+    return self.scheduler.stats()
+
+  def record_env_values(self, env_values):
+    for key, value in env_values.items():
+      buffer = self.buffers.get(key)
+      if buffer is None:
+        buffer = self.buffers[key] = SensorRingBuffer(self.windows)
+      buffer.push(value)
+    self.sample_count += 1
 
-    for entry in self.history:
-      for key in avg_values:
-        avg_values[key] += entry[key]
+  # 구간(1min, 5min, 1h) 안의 센서별 평균/최소/최대/표준편차
+  def get_window_stats(self, window="5min"):
+    return {key: buffer.summary(window) for key, buffer in self.buffers.items()}
 
-    # 평균 계산
-    for key in avg_values:
-      avg_values[key] /= len(self.history)
+  def print_avg_data(self, window="5min"):
+    avg_values = {key: stats["mean"] for key, stats in self.get_window_stats(window).items()}
+    self.output.write_average(window, time.time(), avg_values)
 
-    print("5-Minute Average Sensor Data:")
-    print(json.dumps(avg_values, indent=4))
+  # 센서 하나를 interval 초마다 읽어서 (이름, 시각, 주기, 값 복사본)을 큐에 넣음
+  # 주기는 설정(interval.<이름>)이 바뀌면 다음 측정부터 반영
+  async def poll_sensor(self, name, sensor, interval, queue):
+    next_time = time.monotonic()
+    while not self.stop_event.is_set():
+      keys = self.enabled_sensor_keys()
+      sensor.set_env(keys)
+      env_values = sensor.get_env()
+      current_interval = self.config_watcher.interval(name, interval)
+      await queue.put((name, time.time(), current_interval, {key: env_values[key] for key in keys}))
+      next_time += current_interval
+      try:
+        # 기다리는 동안 stop() 이 호출되면 바로 깨어남
+        await asyncio.wait_for(self.stop_event.wait(), max(0.0, next_time - time.monotonic()))
+      except asyncio.TimeoutError:
+        pass
+
+  # 큐에서 측정값을 꺼내 센서별 링 버퍼에 반영 (None 을 받으면 종료)
+  # 센서의 주기가 바뀌어 구간 크기가 달라지면 그 센서의 버퍼만 새로 만듦 (동기 모드의 reset_windows 와 같음)
+  async def aggregate_readings(self, queue):
+    while True:
+      reading = await queue.get()
+      if reading is None:
+        break
+      name, _, interval, env_values = reading
+      windows = self.window_sizes(interval)
+      if windows != self.sensor_windows.get(name):
+        self.sensor_windows[name] = windows
+        self.sensor_buffers[name] = {}
+      buffers = self.sensor_buffers[name]
+      for key, value in env_values.items():
+        buffer = buffers.get(key)
+        if buffer is None:
+          buffer = buffers[key] = SensorRingBuffer(windows)
+        buffer.push(value)
+      self.reading_count += 1
+
+  # 여러 센서를 각자의 주기로 동시에 읽음
+  # sensors: {이름: 센서}, intervals: {이름: 주기(초)} (없으면 설정 파일 값), duration 초 뒤 또는 stop() 시 종료
+  async def run_async(self, sensors, intervals=None, duration=None, queue_size=10000):
+    intervals = intervals or {}
+    self.stop_event = asyncio.Event()
+    queue = asyncio.Queue(maxsize=queue_size)
+    aggregator = asyncio.create_task(self.aggregate_readings(queue))
+    pollers = [
+      asyncio.create_task(self.poll_sensor(name, sensor, intervals.get(name), queue))
+      for name, sensor in sensors.items()
+    ]
+    try:
+      if duration is None:
+        await self.stop_event.wait()
+      else:
+        try:
+          await asyncio.wait_for(self.stop_event.wait(), duration)
+        except asyncio.TimeoutError:
+          pass
+    finally:
+      # 센서 작업을 먼저 끝낸 뒤 큐에 남은 값까지 반영하고 집계 작업 종료
+      self.stop_event.set()
+      await asyncio.gather(*pollers, return_exceptions=True)
+      await queue.put(None)
+      await aggregator
+
+  def get_sensor_window_stats(self, name, window="5min"):
+    return {key: buffer.summary(window) for key, buffer in self.sensor_buffers.get(name, {}).items()}
 
   def stop(self):
     self.stop_flag = True
-    print("System stopped...")
+    if self.cpu_sampler is not None:
+      self.cpu_sampler.stop()
+    if self.scheduler is not None:
+      print("Sampling Schedule Stats:", file=self.diagnostics)
+      print(json.dumps(self.get_schedule_stats(), indent=4), file=self.diagnostics)
+    if self.stop_event is not None:
+      self.stop_event.set()
+    print("System stopped...", file=self.diagnostics)
 
 
-ds = DummySensor()
-runComputer = MissionComputer(ds)
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Mars mission computer')
+  parser.add_argument('--async-sensors', type=int, default=0, help='asyncio 모드로 동시에 읽을 센서 수')
+  parser.add_argument('--duration', type=float, default=None, help='asyncio 모드 실행 시간 (초)')
+  parser.add_argument('--store', help='측정값을 저장할 디렉터리 (예: telemetry)')
+  parser.add_argument('--format', choices=list(SINKS), default='pretty', help='측정값 출력 형식')
+  parser.add_argument('--output', default='-', help="출력 대상: '-'(표준 출력), 파일 경로 또는 unix:<소켓 경로>")
+  parser.add_argument('--flush-every', type=int, default=1, help='레코드 몇 개마다 flush 할지')
+  args = parser.parse_args()
+  # asyncio 모드의 측정값은 센서 이름별 링 버퍼에만 모으므로 출력 형식/저장 옵션과 함께 쓸 수 없음
+  if args.async_sensors and (args.store or args.format != 'pretty' or args.output != '-'):
+    parser.error('--store, --format and --output are not supported with --async-sensors')
 
-try:
-  runComputer.get_mission_computer_info()
-  runComputer.get_mission_computer_load()
-  print('--------------- If you want stop it, plese input Ctrl+C ---------------')
-  runComputer.get_sensor_data()
-except KeyboardInterrupt:
-  runComputer.stop()
+  store = None
+  if args.store:
+    from telemetry_store import TelemetryStore
+    store = TelemetryStore(args.store)
+
+  output = open_sink(args.format, args.output, flush_every=args.flush_every)
+
+  ds = DummySensor()
+  runComputer = MissionComputer(ds, store, output)
+
+  if args.async_sensors:
+    sensors = {f'sensor_{i}': DummySensor() for i in range(args.async_sensors)}
+    try:
+      asyncio.run(runComputer.run_async(sensors, duration=args.duration))
+    except KeyboardInterrupt:
+      runComputer.stop()
+    finally:
+      output.close()
+    print(f'{runComputer.reading_count} readings from {len(sensors)} sensors')
+    print(json.dumps(runComputer.get_sensor_window_stats('sensor_0', '1min'), indent=4))
+  else:
+    try:
+      runComputer.get_mission_computer_info()
+      runComputer.get_mission_computer_load()
+      print('--------------- If you want stop it, plese input Ctrl+C ---------------', file=runComputer.diagnostics)
+      runComputer.get_sensor_data()
+    except KeyboardInterrupt:
+      runComputer.stop()
+    finally:
+      output.close()
+      if store is not None:
+        store.close()
@@ -0,0 +1,43 @@
+import os
+import time
+import random
+import tempfile
+import argparse
+
+from telemetry_store import SENSOR_KEYS
+from telemetry_output import SINKS, open_sink, read_binary_telemetry
+
+# 벤치마크용 가짜 측정값 (값 dict 은 미리 만들어 두고 출력 시간만 잼)
+def make_readings(count, seed=0):
+  rng = random.Random(seed)
+  return [
+    (1700000000.0 + i * 5, {key: round(rng.uniform(0, 100), 2) for key in SENSOR_KEYS})
+    for i in range(count)
+  ]
+
+# 출력 형식 하나로 모든 측정값을 쓰는 데 걸린 시간 측정 (파일을 닫을 때까지 포함)
+def time_sink(kind, path, readings, flush_every):
+  start = time.perf_counter()
+  with open_sink(kind, path, flush_every=flush_every) as sink:
+    for epoch, env_values in readings:
+      sink.write_reading(epoch, env_values)
+  return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Telemetry output sink throughput')
+  parser.add_argument('--readings', type=int, default=200000)
+  parser.add_argument('--flush-every', type=int, default=1000, help='레코드 몇 개마다 flush 할지')
+  args = parser.parse_args()
+
+  readings = make_readings(args.readings)
+  with tempfile.TemporaryDirectory() as temp_dir:
+    for kind in SINKS:
+      path = os.path.join(temp_dir, f'telemetry.{kind}')
+      elapsed = time_sink(kind, path, readings, args.flush_every)
+      size = os.path.getsize(path)
+      print(f'{kind:>7}: {elapsed:.3f} s, {len(readings) / elapsed:,.0f} readings/s, {size / len(readings):.1f} B/reading')
+
+    # 이진 파일을 다시 읽어서 값이 그대로인지 확인
+    decoded = list(read_binary_telemetry(os.path.join(temp_dir, 'telemetry.binary')))
+    print(f'binary round trip: {decoded[-1][2] == readings[-1][1] and len(decoded) == len(readings)}')
@@ -0,0 +1,171 @@
+import io
+import sys
+import json
+import math
+import socket
+import struct
+
+from telemetry_store import SENSOR_KEYS
+
+# 출력 종류: 측정값, 구간 평균
+RECORD_KINDS = ["reading", "1min", "5min", "1h"]
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# 이진 스트림 구조 (little-endian)
+#   헤더: magic(4) = b'MTLM', version(u16), 센서 수(u16), 센서 이름 길이(u32), 센서 이름 (utf-8, '\n' 으로 구분)
+#   레코드: 종류(u8, RECORD_KINDS 순서) + 패딩(7) + epoch(float64) + 센서 값(float64 x 센서 수)
+# 측정하지 않은 센서 값은 NaN
+STREAM_MAGIC = b'MTLM'
+STREAM_VERSION = 1
+STREAM_HEADER = struct.Struct('<4sHHI')
+
+# target 이 None 또는 '-' 이면 표준 출력, 'unix:<경로>' 이면 UNIX 소켓, 그 외에는 파일에 이어 씀
+# (파일 객체, 비어 있는 대상인지) 반환
+def open_target(target, binary):
+  if target is None or target == '-':
+    return (sys.stdout.buffer if binary else sys.stdout), True
+  if target.startswith('unix:'):
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.connect(target[5:])
+    file = connection.makefile('wb', buffering=WRITE_BUFFER_SIZE)
+    connection.close()  # makefile 이 소켓을 계속 참조하므로 파일을 닫을 때 연결도 닫힘
+    if not binary:
+      file = io.TextIOWrapper(file, encoding='utf-8', newline='')
+    return file, True
+  if binary:
+    file = open(target, 'ab', buffering=WRITE_BUFFER_SIZE)
+  else:
+    file = open(target, 'a', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE)
+  return file, file.tell() == 0
+
+def format_value(value):
+  return 'null' if value is None else repr(value)
+
+# 모든 출력 형식의 공통 부분 (필드 순서는 만들 때 한 번만 정함)
+# write_reading / write_average 는 MissionComputer 가 틱마다 호출
+class TelemetrySink:
+  binary = False
+
+  def __init__(self, target=None, keys=None, flush_every=1):
+    self.keys = list(keys or SENSOR_KEYS)
+    self.flush_every = flush_every
+    self.pending = 0
+    self.file, empty = open_target(target, self.binary)
+    self.owns_file = self.file not in (sys.stdout, sys.stdout.buffer)
+    if empty:
+      self.write_header()
+
+  def write_header(self):
+    pass
+
+  def encode(self, kind, epoch, values):
+    raise NotImplementedError
+
+  def write(self, kind, epoch, values):
+    self.file.write(self.encode(kind, epoch, values))
+    self.pending += 1
+    if self.pending >= self.flush_every:
+      self.flush()
+
+  def write_reading(self, epoch, env_values):
+    self.write("reading", epoch, env_values)
+
+  def write_average(self, window, epoch, avg_values):
+    self.write(window, epoch, avg_values)
+
+  def flush(self):
+    self.pending = 0
+    self.file.flush()
+
+  def close(self):
+    self.flush()
+    if self.owns_file:
+      self.file.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.close()
+
+# 기존 출력 형식 (json.dumps(indent=4), 사람이 읽기 위한 용도)
+class PrettyJsonSink(TelemetrySink):
+  def encode(self, kind, epoch, values):
+    if kind == "reading":
+      title = "Current Sensor Data:"
+    elif kind == "5min":
+      title = "5-Minute Average Sensor Data:"
+    else:
+      title = f"{kind} Average Sensor Data:"
+    return f"{title}\n{json.dumps(values, indent=4)}\n"
+
+# 한 줄에 JSON 객체 하나 (필드 순서가 고정된 템플릿에 값만 채움)
+class NdjsonSink(TelemetrySink):
+  def __init__(self, target=None, keys=None, flush_every=1):
+    super().__init__(target, keys, flush_every)
+    fields = ''.join(f',{json.dumps(key)}:%s' for key in self.keys)
+    self.template = '{"type":"%s","epoch":%r' + fields + '}\n'
+
+  def encode(self, kind, epoch, values):
+    return self.template % (kind, epoch, *[format_value(values.get(key)) for key in self.keys])
+
+# 헤더 한 줄 + 측정마다 한 줄 (빈 값은 빈 칸)
+class CsvSink(TelemetrySink):
+  def __init__(self, target=None, keys=None, flush_every=1):
+    super().__init__(target, keys, flush_every)
+    self.template = '%s,%r' + ',%s' * len(self.keys) + '\n'
+
+  def write_header(self):
+    self.file.write(','.join(['type', 'epoch'] + self.keys) + '\n')
+
+  def encode(self, kind, epoch, values):
+    row = []
+    for key in self.keys:
+      value = values.get(key)
+      row.append('' if value is None else repr(value))
+    return self.template % (kind, epoch, *row)
+
+# 고정 길이 이진 레코드 (미리 만든 버퍼에 pack_into 로 채워서 그대로 씀)
+class BinarySink(TelemetrySink):
+  binary = True
+
+  def __init__(self, target=None, keys=None, flush_every=1):
+    self.record = struct.Struct(f'<B7xd{len(keys or SENSOR_KEYS)}d')
+    self.buffer = bytearray(self.record.size)
+    super().__init__(target, keys, flush_every)
+
+  def write_header(self):
+    names = '\n'.join(self.keys).encode('utf-8')
+    self.file.write(STREAM_HEADER.pack(STREAM_MAGIC, STREAM_VERSION, len(self.keys), len(names)) + names)
+
+  def encode(self, kind, epoch, values):
+    self.record.pack_into(
+      self.buffer, 0, RECORD_KINDS.index(kind), epoch,
+      *[math.nan if values.get(key) is None else values[key] for key in self.keys]
+    )
+    return self.buffer
+
+# BinarySink 로 저장한 파일 읽기: (종류, epoch, {센서: 값}) 를 차례로 넘겨줌
+def read_binary_telemetry(file_path):
+  with open(file_path, 'rb') as file:
+    magic, version, key_count, names_size = STREAM_HEADER.unpack(file.read(STREAM_HEADER.size))
+    if magic != STREAM_MAGIC or version != STREAM_VERSION:
+      raise ValueError(f'{file_path} is not a telemetry stream')
+    keys = file.read(names_size).decode('utf-8').split('\n')
+    record = struct.Struct(f'<B7xd{key_count}d')
+    while True:
+      data = file.read(record.size)
+      if len(data) < record.size:
+        break
+      fields = record.unpack(data)
+      yield RECORD_KINDS[fields[0]], fields[1], dict(zip(keys, fields[2:]))
+
+SINKS = {
+  'pretty': PrettyJsonSink,
+  'ndjson': NdjsonSink,
+  'csv': CsvSink,
+  'binary': BinarySink
+}
+
+def open_sink(kind, target=None, keys=None, flush_every=1):
+  return SINKS[kind](target, keys, flush_every)
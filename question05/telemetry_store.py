@@ -0,0 +1,199 @@
+import os
+import json
+import math
+import struct
+
+SENSOR_KEYS = [
+  "mars_base_internal_temperature",
+  "mars_base_external_temperature",
+  "mars_base_internal_humidity",
+  "mars_base_external_illuminance",
+  "mars_base_internal_co2",
+  "mars_base_internal_oxygen"
+]
+SEGMENT_SECONDS = 86400  # 원본 세그먼트 하나가 담는 시간 (하루)
+ROLLUP_RESOLUTIONS = {"1min": 60, "5min": 300, "1h": 3600}
+ROLLUP_SEGMENT_RECORDS = 10080  # 요약 세그먼트 하나가 담는 구간 수 (1분 요약이면 7일)
+
+# 저장소 디렉터리 구조
+#   schema.json                 센서 이름 순서
+#   raw/<시작 epoch>.bin        원본 측정값: epoch(float64) + 센서 값(float64 x 센서 수), 시간순으로 이어 붙임
+#   1min|5min|1h/<시작 epoch>.bin
+#                               요약: 구간 시작 epoch(float64) + 측정 횟수(uint32) + 센서별 값 개수(uint32 x 센서 수)
+#                                     + 8바이트 정렬용 패딩 + 센서별 (평균, 최소, 최대)(float64 x 3)
+# 측정하지 않은 센서 값(NaN)은 요약에서 빠지며, 값이 하나도 없는 센서의 평균/최소/최대는 NaN
+# 모든 레코드는 고정 길이라서 세그먼트 안에서는 이진 탐색으로 시간 위치를 찾음
+class TelemetryStore:
+  def __init__(self, base_dir, keys=None):
+    self.base_dir = base_dir
+    os.makedirs(base_dir, exist_ok=True)
+    self.keys = self.load_schema(keys or SENSOR_KEYS)
+    sensor_count = len(self.keys)
+    self.raw_record = struct.Struct(f"<{1 + sensor_count}d")
+    padding = -4 * (1 + sensor_count) % 8
+    self.rollup_record = struct.Struct(f"<d{1 + sensor_count}I{padding}x{3 * sensor_count}d")
+    # 열려 있는 세그먼트: 이름 -> (세그먼트 시작 epoch, 파일)
+    self.segments = {}
+    # 아직 끝나지 않은 요약 구간: 이름 -> [구간 시작, 측정 횟수, 센서별 개수, 합계들, 최소들, 최대들]
+    self.buckets = {}
+
+  # 처음 만들 때 센서 순서를 저장하고, 이후에는 저장된 순서를 사용
+  def load_schema(self, keys):
+    schema_path = os.path.join(self.base_dir, "schema.json")
+    if os.path.exists(schema_path):
+      with open(schema_path, "r", encoding="utf-8") as file:
+        return json.load(file)["keys"]
+    with open(schema_path, "w", encoding="utf-8") as file:
+      json.dump({"keys": list(keys)}, file)
+    return list(keys)
+
+  def segment_span(self, name):
+    if name == "raw":
+      return SEGMENT_SECONDS
+    return ROLLUP_RESOLUTIONS[name] * ROLLUP_SEGMENT_RECORDS
+
+  # epoch 가 속한 세그먼트 파일 (구간이 바뀌면 이전 파일을 닫고 새 파일로 교체)
+  def segment_file(self, name, epoch):
+    span = self.segment_span(name)
+    start = int(epoch // span * span)
+    current = self.segments.get(name)
+    if current is not None and current[0] == start:
+      return current[1]
+    if current is not None:
+      current[1].close()
+    directory = os.path.join(self.base_dir, name)
+    os.makedirs(directory, exist_ok=True)
+    file = open(os.path.join(directory, f"{start}.bin"), "ab")
+    self.segments[name] = (start, file)
+    return file
+
+  # 측정값 하나를 원본 세그먼트에 추가하고 요약 구간을 갱신 (측정하지 않은 센서는 NaN)
+  def append(self, epoch, env_values):
+    values = [float(env_values.get(key, math.nan)) for key in self.keys]
+    self.segment_file("raw", epoch).write(self.raw_record.pack(epoch, *values))
+    for name, resolution in ROLLUP_RESOLUTIONS.items():
+      self.update_bucket(name, resolution, epoch, values)
+
+  def update_bucket(self, name, resolution, epoch, values):
+    bucket_start = epoch // resolution * resolution
+    bucket = self.buckets.get(name)
+    if bucket is not None and bucket[0] != bucket_start:
+      self.write_bucket(name, bucket)
+      bucket = None
+    if bucket is None:
+      sensor_count = len(values)
+      bucket = self.buckets[name] = [
+        bucket_start, 0, [0] * sensor_count, [0.0] * sensor_count, [math.inf] * sensor_count, [-math.inf] * sensor_count
+      ]
+    bucket[1] += 1
+    counts, sums, minimums, maximums = bucket[2], bucket[3], bucket[4], bucket[5]
+    for i, value in enumerate(values):
+      if math.isnan(value):
+        continue
+      counts[i] += 1
+      sums[i] += value
+      if value < minimums[i]:
+        minimums[i] = value
+      if value > maximums[i]:
+        maximums[i] = value
+
+  def write_bucket(self, name, bucket):
+    bucket_start, count, counts, sums, minimums, maximums = bucket
+    fields = []
+    for sensor_count, total, minimum, maximum in zip(counts, sums, minimums, maximums):
+      if sensor_count:
+        fields.extend((total / sensor_count, minimum, maximum))
+      else:
+        fields.extend((math.nan, math.nan, math.nan))
+    self.segment_file(name, bucket_start).write(self.rollup_record.pack(bucket_start, count, *counts, *fields))
+
+  def flush(self):
+    for _, file in self.segments.values():
+      file.flush()
+
+  # 끝나지 않은 요약 구간도 저장하고 파일을 닫음 (같은 구간이 나중에 또 저장되면 읽을 때 합침)
+  def close(self):
+    for name, bucket in self.buckets.items():
+      self.write_bucket(name, bucket)
+    self.buckets = {}
+    for _, file in self.segments.values():
+      file.close()
+    self.segments = {}
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.close()
+
+  # start ~ end 와 겹치는 세그먼트 파일 목록 (시간순)
+  def segment_paths(self, name, start=None, end=None):
+    directory = os.path.join(self.base_dir, name)
+    if not os.path.isdir(directory):
+      return []
+    span = self.segment_span(name)
+    starts = sorted(int(file_name[:-4]) for file_name in os.listdir(directory) if file_name.endswith(".bin"))
+    return [
+      os.path.join(directory, f"{segment_start}.bin")
+      for segment_start in starts
+      if (end is None or segment_start <= end) and (start is None or segment_start + span > start)
+    ]
+
+  # 세그먼트 하나에서 start 이상 end 이하 레코드를 읽음 (시작 위치는 이진 탐색)
+  def read_segment(self, path, record, start, end):
+    with open(path, "rb") as file:
+      count = os.path.getsize(path) // record.size
+      low, high = 0, count
+      if start is not None:
+        while low < high:
+          middle = (low + high) // 2
+          file.seek(middle * record.size)
+          (epoch,) = struct.unpack("<d", file.read(8))
+          if epoch < start:
+            low = middle + 1
+          else:
+            high = middle
+      file.seek(low * record.size)
+      for _ in range(low, count):
+        fields = record.unpack(file.read(record.size))
+        if end is not None and fields[0] > end:
+          break
+        yield fields
+
+  # 원본 측정값 (epoch, {센서: 값})
+  def read_raw(self, start=None, end=None):
+    self.flush()
+    for path in self.segment_paths("raw", start, end):
+      for fields in self.read_segment(path, self.raw_record, start, end):
+        yield fields[0], dict(zip(self.keys, fields[1:]))
+
+  # 요약 값 목록 [{"epoch", "count", 센서: {"count", "mean", "min", "max"}}] (같은 구간이 여러 번 저장됐으면 합침)
+  # 값이 없는 센서의 평균/최소/최대는 NaN
+  def read_rollup(self, window, start=None, end=None):
+    self.flush()
+    sensor_count = len(self.keys)
+    rows = {}
+    for path in self.segment_paths(window, start, end):
+      for fields in self.read_segment(path, self.rollup_record, start, end):
+        epoch = fields[0]
+        row = rows.get(epoch)
+        if row is None:
+          row = rows[epoch] = {"epoch": epoch, "count": 0}
+          for key in self.keys:
+            row[key] = {"count": 0, "mean": math.nan, "min": math.nan, "max": math.nan}
+        row["count"] += fields[1]
+        for i, key in enumerate(self.keys):
+          count = fields[2 + i]
+          if not count:
+            continue
+          base = 2 + sensor_count + 3 * i
+          mean, minimum, maximum = fields[base:base + 3]
+          stats = row[key]
+          if stats["count"] == 0:
+            stats.update(mean=mean, min=minimum, max=maximum)
+          else:
+            stats["mean"] += (mean - stats["mean"]) * count / (stats["count"] + count)
+            stats["min"] = min(stats["min"], minimum)
+            stats["max"] = max(stats["max"], maximum)
+          stats["count"] += count
+    return [rows[epoch] for epoch in sorted(rows)]
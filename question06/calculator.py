@@ -4,6 +4,8 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt
 
+from expression_engine import evaluate
+
 
 class Calculator(QWidget):
   def __init__(self):
@@ -121,9 +123,10 @@ class Calculator(QWidget):
       except:
         self.expression = "Error"
     elif text == '=':
+      # eval 대신 식 엔진으로 계산 (같은 식은 한 번만 파싱)
       try:
-        self.expression = str(eval(self.expression))
-      except:
+        self.expression = str(evaluate(self.expression))
+      except (ValueError, ArithmeticError):
         self.expression = "Error"
     else:
       self.expression += text
@@ -0,0 +1,211 @@
+import re
+import sys
+import time
+import random
+import argparse
+import operator
+
+# 계산기 식 엔진 (PyQt 없이 사용 가능)
+# 문자열 -> 토큰 -> shunting-yard 로 후위 표기(RPN) -> 스택으로 계산
+# eval 을 쓰지 않으므로 숫자와 연산자, 괄호 외에는 계산하지 않음
+# 처리 속도: 컴파일된 식 계산은 초당 수십만 개, 파싱까지 포함하면 그보다 한 자릿수 느림
+# evaluate_batch 가 초당 수백만 개를 처리하는 것은 같은 식이 반복될 때 결과를 재사용하기 때문
+
+# 숫자(1, 1.5, .5, 5., 1e3) 또는 연산자/괄호, 앞의 공백은 건너뜀
+TOKEN_PATTERN = re.compile(r'\s*(?:((?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)|(\*\*|//|[-+*/%()]))')
+MAX_RESULT_BITS = 1000000  # 정수 거듭제곱 결과 크기 상한 (9**9**9 처럼 끝나지 않는 계산 방지)
+CACHE_SIZE = 100000
+
+class ExpressionError(ValueError):
+  pass
+
+# 결과의 비트 수는 대략 밑의 비트 수 x 지수이므로 계산하기 전에 크기를 확인
+def power(base, exponent):
+  if isinstance(base, int) and isinstance(exponent, int) and exponent > 0:
+    if abs(base).bit_length() * exponent > MAX_RESULT_BITS:
+      raise ExpressionError(f'Result too large: about {abs(base).bit_length() * exponent} bits')
+  return base ** exponent
+
+# 연산자: (우선순위, 오른쪽 결합 여부, 피연산자 수, 함수) -- 우선순위와 결합 방향은 Python 과 같음
+# 'neg', 'pos' 는 단항 -, +
+OPERATORS = {
+  '+': (1, False, 2, operator.add),
+  '-': (1, False, 2, operator.sub),
+  '*': (2, False, 2, operator.mul),
+  '/': (2, False, 2, operator.truediv),
+  '//': (2, False, 2, operator.floordiv),
+  '%': (2, False, 2, operator.mod),
+  'neg': (3, True, 1, operator.neg),
+  'pos': (3, True, 1, operator.pos),
+  '**': (4, True, 2, power)
+}
+
+# 문자열을 (종류, 값) 토큰 목록으로 나눔 (종류: 'number', 'op', '(', ')')
+def tokenize(text):
+  tokens = []
+  position = 0
+  text = text.rstrip()
+  while position < len(text):
+    match = TOKEN_PATTERN.match(text, position)
+    if match is None:
+      raise ExpressionError(f'Unexpected character at {position}: {text[position:].strip()[:1]!r}')
+    number, symbol = match.groups()
+    if number is not None:
+      tokens.append(('number', float(number) if '.' in number or 'e' in number.lower() else int(number)))
+    elif symbol in '()':
+      tokens.append((symbol, symbol))
+    else:
+      tokens.append(('op', symbol))
+    position = match.end()
+  return tokens
+
+# shunting-yard: 토큰을 후위 표기 목록으로 변환 (숫자는 값 그대로, 연산자는 OPERATORS 의 키)
+def to_rpn(tokens):
+  output = []
+  stack = []
+  expect_operand = True  # 다음 토큰이 피연산자 자리인지 (이 자리의 +, - 는 단항 연산자)
+  for kind, value in tokens:
+    if kind == 'number':
+      if not expect_operand:
+        raise ExpressionError(f'Missing operator before {value}')
+      output.append(value)
+      expect_operand = False
+    elif kind == '(':
+      if not expect_operand:
+        raise ExpressionError('Missing operator before (')
+      stack.append(value)
+    elif kind == ')':
+      if expect_operand:
+        raise ExpressionError('Missing operand before )')
+      while stack and stack[-1] != '(':
+        output.append(stack.pop())
+      if not stack:
+        raise ExpressionError('Unbalanced )')
+      stack.pop()
+    elif expect_operand:
+      if value not in ('+', '-'):
+        raise ExpressionError(f'Missing operand before {value}')
+      stack.append('neg' if value == '-' else 'pos')
+    else:
+      precedence, right, _, _ = OPERATORS[value]
+      while stack and stack[-1] != '(':
+        top_precedence = OPERATORS[stack[-1]][0]
+        if top_precedence > precedence or (top_precedence == precedence and not right):
+          output.append(stack.pop())
+        else:
+          break
+      stack.append(value)
+      expect_operand = True
+  if expect_operand:
+    raise ExpressionError('Incomplete expression')
+  while stack:
+    if stack[-1] == '(':
+      raise ExpressionError('Unbalanced (')
+    output.append(stack.pop())
+  return output
+
+# 컴파일된 식: RPN 을 (피연산자 수, 함수 또는 숫자) 튜플로 바꿔 두고 계산할 때는 스택만 사용
+class CompiledExpression:
+  def __init__(self, text):
+    self.text = text
+    self.rpn = to_rpn(tokenize(text))
+    self.program = tuple(
+      (OPERATORS[item][2], OPERATORS[item][3]) if isinstance(item, str) else (0, item)
+      for item in self.rpn
+    )
+
+  def evaluate(self):
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    for arity, item in self.program:
+      if arity == 0:
+        push(item)
+      elif arity == 1:
+        stack[-1] = item(stack[-1])
+      else:
+        right = pop()
+        stack[-1] = item(stack[-1], right)
+    return stack[0]
+
+compiled_cache = {}
+
+# 같은 식은 한 번만 파싱 (캐시가 가득 차면 비움)
+def compile_expression(text):
+  compiled = compiled_cache.get(text)
+  if compiled is None:
+    if len(compiled_cache) >= CACHE_SIZE:
+      compiled_cache.clear()
+    compiled = compiled_cache[text] = CompiledExpression(text)
+  return compiled
+
+# 식 하나 계산 (잘못된 식은 ExpressionError, 0으로 나누기는 ZeroDivisionError)
+def evaluate(text):
+  return compile_expression(text).evaluate()
+
+# 여러 식을 한 번에 계산 (변수가 없으므로 같은 식의 결과는 한 번만 계산)
+# 계산할 수 없는 식의 결과는 default
+def evaluate_batch(expressions, default=None):
+  results = {}
+  values = []
+  for text in expressions:
+    value = results.get(text, results)
+    if value is results:
+      try:
+        value = compile_expression(text).evaluate()
+      except (ValueError, ArithmeticError):
+        value = default
+      results[text] = value
+    values.append(value)
+  return values
+
+# 벤치마크용 임의의 식 (distinct 개의 서로 다른 식을 count 개로 반복)
+def make_expressions(count, distinct, seed=0):
+  rng = random.Random(seed)
+  pool = []
+  for _ in range(distinct):
+    terms = [str(rng.randint(1, 999)) for _ in range(rng.randint(2, 6))]
+    text = terms[0]
+    for term in terms[1:]:
+      text += rng.choice('+-*/') + term
+    pool.append(text)
+  return [pool[i % distinct] for i in range(count)]
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Calculator expression engine (headless)')
+  parser.add_argument('file', nargs='?', help='한 줄에 식 하나씩 (없으면 표준 입력)')
+  parser.add_argument('--benchmark', type=int, metavar='COUNT', help='임의의 식 COUNT 개로 처리 속도 측정')
+  parser.add_argument('--distinct', type=int, default=1000, help='벤치마크에서 서로 다른 식의 수')
+  args = parser.parse_args()
+
+  if args.benchmark:
+    expressions = make_expressions(args.benchmark, args.distinct)
+    start = time.perf_counter()
+    for text in expressions[:args.distinct]:
+      CompiledExpression(text).evaluate()
+    elapsed = time.perf_counter() - start
+    print(f'{"parse + evaluate":>17}: {min(args.distinct, args.benchmark) / elapsed:,.0f} distinct expressions/s')
+    compiled = [compile_expression(text) for text in expressions[:args.distinct]]
+    start = time.perf_counter()
+    for expression in compiled:
+      expression.evaluate()
+    elapsed = time.perf_counter() - start
+    print(f'{"compiled evaluate":>17}: {len(compiled) / elapsed:,.0f} distinct expressions/s')
+    start = time.perf_counter()
+    evaluate_batch(expressions)
+    elapsed = time.perf_counter() - start
+    print(
+      f'{"evaluate_batch":>17}: {len(expressions) / elapsed:,.0f} expressions/s '
+      f'({len(expressions):,} expressions, {min(args.distinct, args.benchmark):,} distinct; repeats reuse results)'
+    )
+  else:
+    file = open(args.file, 'r', encoding='utf-8') if args.file else sys.stdin
+    with file:
+      lines = [line.strip() for line in file if line.strip()]
+    for line, value in zip(lines, evaluate_batch(lines, 'Error')):
+      try:
+        print(f'{line} = {value}')
+      except ValueError:
+        # 너무 긴 정수는 문자열로 바꿀 수 없음 (sys.get_int_max_str_digits)
+        print(f'{line} = Error')